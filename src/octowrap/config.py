@@ -1,6 +1,7 @@
 """Load octowrap settings from pyproject.toml [tool.octowrap]."""
 
-import tomllib
+import functools
+from collections.abc import Callable
 from pathlib import Path
 
 
@@ -8,23 +9,76 @@ class ConfigError(Exception):
     """Raised when the [tool.octowrap] section contains invalid settings."""
 
 
-_SCALAR_KEYS: dict[str, type] = {
-    "line-length": int,
-    "recursive": bool,
-    "inline": bool,
-    "todo-case-sensitive": bool,
-    "todo-multiline": bool,
-    "list-wrap": bool,
+def _check_int(key: str, value: object) -> int:
+    """Validate an integer setting."""
+    # bool is a subclass of int in Python, so guard against it explicitly.
+    if isinstance(value, bool):
+        raise ConfigError(f"Config key {key!r} expects an integer, got a boolean")
+    if not isinstance(value, int):
+        raise ConfigError(f"Config key {key!r} expects int, got {type(value).__name__}")
+    return value
+
+
+def _check_bool(key: str, value: object) -> bool:
+    """Validate a boolean setting."""
+    if not isinstance(value, bool):
+        raise ConfigError(
+            f"Config key {key!r} expects bool, got {type(value).__name__}"
+        )
+    return value
+
+
+def _check_str_list(key: str, value: object) -> list[str]:
+    """Validate a list-of-strings setting and return a copy of it."""
+    if not isinstance(value, list):
+        raise ConfigError(
+            f"Config key {key!r} expects a list of strings, got {type(value).__name__}"
+        )
+    for i, item in enumerate(value):
+        if not isinstance(item, str):
+            raise ConfigError(
+                f"Config key {key!r} expects a list of strings, "
+                f"but element {i} is {type(item).__name__}"
+            )
+    # Copy so callers can't mutate the cached parse result.
+    return list(value)
+
+
+# Each validator raises ConfigError on a bad value and returns the value to store.
+_VALIDATORS: dict[str, Callable[[str, object], object]] = {
+    "line-length": _check_int,
+    "recursive": _check_bool,
+    "inline": _check_bool,
+    "todo-case-sensitive": _check_bool,
+    "todo-multiline": _check_bool,
+    "list-wrap": _check_bool,
+    "exclude": _check_str_list,
+    "extend-exclude": _check_str_list,
+    "todo-patterns": _check_str_list,
+    "extend-todo-patterns": _check_str_list,
 }
 
-_LIST_STR_KEYS: set[str] = {
-    "exclude",
-    "extend-exclude",
-    "todo-patterns",
-    "extend-todo-patterns",
-}
+VALID_KEYS: set[str] = set(_VALIDATORS)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_toml(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse the TOML file at *path*.
+
+    *mtime_ns* and *size* are unused here; they only extend the cache key so an edited
+    file is parsed again.
+    """
+    # Deferred so runs without a pyproject.toml never import the TOML parser.
+    import tomllib
 
-VALID_KEYS: set[str] = {*_SCALAR_KEYS, *_LIST_STR_KEYS}
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _load_toml(path: Path) -> dict:
+    """Parse *path*, reusing the cached result while the file is unchanged on disk."""
+    st = path.stat()
+    return _parse_toml(str(path.absolute()), st.st_mtime_ns, st.st_size)
 
 
 def find_config_file(start_dir: Path | None = None) -> Path | None:
@@ -40,9 +94,10 @@ def find_config_file(start_dir: Path | None = None) -> Path | None:
     while True:
         candidate = current / "pyproject.toml"
         if candidate.is_file():
+            import tomllib
+
             try:
-                with open(candidate, "rb") as f:
-                    data = tomllib.load(f)
+                data = _load_toml(candidate)
                 if "tool" in data and "octowrap" in data["tool"]:
                     return candidate
             except tomllib.TOMLDecodeError as e:
@@ -68,45 +123,18 @@ def load_config(config_path: Path | None = None) -> dict:
     if config_path is None:
         return {}
 
-    with open(config_path, "rb") as f:
-        data = tomllib.load(f)
+    data = _load_toml(config_path)
 
-    section = data.get("tool", {}).get("octowrap", {})
+    tool = data.get("tool")
+    section = tool.get("octowrap") if tool else None
     if not section:
         return {}
 
     result: dict = {}
     for key, value in section.items():
-        if key not in VALID_KEYS:
+        validate = _VALIDATORS.get(key)
+        if validate is None:
             raise ConfigError(f"Unknown config key: {key!r}")
-
-        if key in _LIST_STR_KEYS:
-            if not isinstance(value, list):
-                raise ConfigError(
-                    f"Config key {key!r} expects a list of strings, "
-                    f"got {type(value).__name__}"
-                )
-            for i, item in enumerate(value):
-                if not isinstance(item, str):
-                    raise ConfigError(
-                        f"Config key {key!r} expects a list of strings, "
-                        f"but element {i} is {type(item).__name__}"
-                    )
-        else:
-            expected_type = _SCALAR_KEYS[key]
-
-            # bool is a subclass of int in Python, so guard against it explicitly.
-            if expected_type is int and isinstance(value, bool):
-                raise ConfigError(
-                    f"Config key {key!r} expects an integer, got a boolean"
-                )
-
-            if not isinstance(value, expected_type):
-                raise ConfigError(
-                    f"Config key {key!r} expects {expected_type.__name__}, "
-                    f"got {type(value).__name__}"
-                )
-
-        result[key] = value
+        result[key] = validate(key, value)
 
     return result
@@ -10,18 +10,25 @@ rewraps them using textwrap. It preserves:
 """
 
 import argparse
+import collections
 import difflib
 import fnmatch
+import functools
+import itertools
 import os
 import re
 import stat
 import sys
-import tempfile
 import textwrap
+from collections.abc import Callable, Generator, Iterable, Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
 from octowrap.config import ConfigError, find_config_file, load_config
 
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
 DEFAULT_EXCLUDES: list[str] = [
     ".git",
     ".hg",
@@ -48,14 +55,142 @@ DEFAULT_TODO_CASE_SENSITIVE: bool = False
 DEFAULT_TODO_MULTILINE: bool = True
 DEFAULT_LIST_WRAP: bool = True
 
+# Below this many files, starting a process pool costs more than it saves.
+_PARALLEL_MIN_FILES: int = 8
+
+
+# Every pattern below is implicitly anchored with ``^\s*``. Each group is fused into a
+# single alternation at import so a comment line costs one regex match, not one per
+# pattern. Keywords sharing a tail are factored into one branch.
+_CODE_PATTERNS: list[str] = [
+    r"[\w_]+\s*=",  # assignment
+    r"def\s+\w+\s*\(",  # function def
+    r"class\s+\w+",  # class def
+    r"(?:import|return|raise|assert|yield|lambda)\s+",  # keyword statements
+    r"from\s+\w+\s+import",  # from import
+    r"(?:if|while|with)\s+.*:",  # if/while/with headers
+    r"for\s+\w+(?:\s*,\s*\w+)*\s+in\s+",  # for loop
+    r"try\s*:",  # try
+    r"except\s*($|[:(]|[A-Z])",  # except
+    r"@\w+",  # decorator
+    r"print\s*\(",  # print call
+    r"self\.",  # self reference
+    r"\w+\.\w+\(",  # method call
+    r"\w+\s*\([^)]*\)\s*$",  # function call
+]
+
+_LIST_PATTERNS: list[str] = [
+    r"[-*•]\s+",  # bullet points
+    r"\d+[.)]\s+",  # numbered lists
+    r"[a-zA-Z][.)]\s+",  # lettered lists
+]
+
+_CODE_RE = re.compile(r"^\s*(?:" + "|".join(_CODE_PATTERNS) + ")")
+_LIST_RE = re.compile(r"^\s*(?:" + "|".join(_LIST_PATTERNS) + ")")
+
+# Same list markers, capturing the marker (with nesting indent) and the item text.
+_LIST_MARKER_RES: tuple[re.Pattern[str], ...] = (
+    re.compile(r"^(\s*[-*•]\s+)(.*)"),  # bullet points
+    re.compile(r"^(\s*\d+[.)]\s+)(.*)"),  # numbered lists
+    re.compile(r"^(\s*[a-zA-Z][.)]\s+)(.*)"),  # lettered lists
+)
+
+_DIRECTIVE_PATTERNS: tuple[str, ...] = (
+    r"type:\s*ignore",  # mypy/pyright inline suppression
+    r"noqa(?:\s*:\s*\S+)?$",  # flake8/ruff lint suppression
+    r"pragma:\s*no\s+(?:cover|branch)",  # coverage.py
+    r"fmt:\s*(?:off|on|skip)",  # black/ruff formatter
+    r"isort:\s*(?:skip|skip_file|split)",  # isort
+    r"pylint:\s*(?:disable|enable)",  # pylint
+    r"mypy:\s*\S",  # mypy config comments
+    r"pyright:\s*\S",  # pyright config comments
+    r"ruff:\s*noqa",  # ruff-specific suppression
+    r"type:\s*\S+",  # PEP 484 type comments (e.g. type: int)
+)
+# Fused into one alternation so a check is a single regex call rather than one per tool.
+_DIRECTIVE_RE = re.compile("|".join(f"(?:{p})" for p in _DIRECTIVE_PATTERNS))
+
+_PROSE_KEYWORD_RE = re.compile(
+    r"(?:if|while|with|return|raise|import|assert|yield)\s+"
+    r"(?:the|this|that|these|those)\s+[a-z]"
+)
+_RETURN_TO_RE = re.compile(r"return\s+to\s+")
+_HYPHEN_END_RE = re.compile(r"[a-zA-Z]-$")
+_PRAGMA_RE = re.compile(r"^\s*#\s*octowrap:\s*(off|on)\s*$", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=64)
+def _todo_regex(patterns: tuple[str, ...], case_sensitive: bool) -> re.Pattern[str]:
+    """Compile TODO *patterns* into one alternation, longest first so prefixes lose.
+
+    The regex captures the marker with its trailing colon and spaces, then the rest.
+    """
+    if not patterns:
+        return re.compile(r"(?!)")  # never matches
+    alternatives = []
+    for p in sorted(patterns, key=len, reverse=True):
+        boundary = r"\b" if re.match(r"\w", p[-1:]) else ""
+        alternatives.append(f"{re.escape(p)}{boundary}")
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(rf"((?:{'|'.join(alternatives)})\s*:?\s*)(.*)", flags)
+
+
+@functools.lru_cache(maxsize=64)
+def _todo_first_chars(
+    patterns: tuple[str, ...], case_sensitive: bool
+) -> frozenset[str] | None:
+    """Return the characters a TODO marker can start with, or ``None`` if unknown.
+
+    Lets most lines be turned away without entering the regex engine. Case-insensitive
+    matching only gets a set when every pattern starts with an ASCII character, and the
+    set is only trusted for ASCII input, because ``re.IGNORECASE`` also pairs some
+    ASCII letters with non-ASCII ones (``k`` with the Kelvin sign, ``s`` with ``ſ``).
+    """
+    if not all(patterns):
+        return None  # an empty pattern matches anything
+    firsts = {p[0] for p in patterns}
+    if case_sensitive:
+        return frozenset(firsts)
+    if not all(c.isascii() for c in firsts):
+        return None
+    return frozenset(c.lower() for c in firsts) | {c.upper() for c in firsts}
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_todo(
+    stripped: str, patterns: tuple[str, ...], case_sensitive: bool
+) -> re.Match[str] | None:
+    """Match *stripped* against the TODO *patterns*, returning the first hit.
+
+    Cached because a TODO line is matched twice in a row: once by
+    :func:`is_todo_marker` when the line is classified, then by
+    :func:`extract_todo_marker` when it is rewrapped.
+    """
+    firsts = _todo_first_chars(patterns, case_sensitive)
+    if firsts is not None:
+        first = stripped[:1]
+        if first not in firsts and (case_sensitive or first.isascii()):
+            return None
+    return _todo_regex(patterns, case_sensitive).match(stripped)
+
+
+@functools.lru_cache(maxsize=16)
+def _exclude_regex(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile exclude glob *patterns* into one regex matched against a path component.
+
+    Matches what :func:`fnmatch.fnmatch` would for any of the patterns.
+    """
+    if not patterns:
+        return re.compile(r"(?!)")  # never matches
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(p)) for p in patterns)
+    )
+
 
 def is_excluded(path: Path, exclude_patterns: list[str]) -> bool:
     """Check if any component of *path* matches an exclude pattern."""
-    for part in path.parts:
-        for pattern in exclude_patterns:
-            if fnmatch.fnmatch(part, pattern):
-                return True
-    return False
+    match = _exclude_regex(tuple(exclude_patterns)).match
+    return any(match(os.path.normcase(part)) for part in path.parts)
 
 
 def _looks_like_prose(text: str) -> bool:
@@ -65,89 +200,55 @@ def _looks_like_prose(text: str) -> bool:
     as "if the server is down:" or "return the result".
     """
     lower = text.strip().lower()
-    determiners = r"(?:the|this|that|these|those)"
-    keywords = r"(?:if|while|with|return|raise|import|assert|yield)"
     # keyword + determiner + word  (e.g. "if the server …")
-    if re.match(rf"{keywords}\s+{determiners}\s+[a-z]", lower):
+    if _PROSE_KEYWORD_RE.match(lower):
         return True
     # "return to …"  (e.g. "return to the caller")
-    if re.match(r"return\s+to\s+", lower):
+    if _RETURN_TO_RE.match(lower):
         return True
     return False
 
 
+@functools.lru_cache(maxsize=4096)
 def is_likely_code(text: str) -> bool:
     """Heuristic: detect if a comment line is probably commented out code."""
-    code_patterns = [
-        r"^\s*[\w_]+\s*=",  # assignment
-        r"^\s*def\s+\w+\s*\(",  # function def
-        r"^\s*class\s+\w+",  # class def
-        r"^\s*import\s+",  # import
-        r"^\s*from\s+\w+\s+import",  # from import
-        r"^\s*if\s+.*:",  # if statement
-        r"^\s*for\s+\w+(?:\s*,\s*\w+)*\s+in\s+",  # for loop
-        r"^\s*while\s+.*:",  # while loop
-        r"^\s*return\s+",  # return
-        r"^\s*raise\s+",  # raise
-        r"^\s*try\s*:",  # try
-        r"^\s*except\s*($|[:(]|[A-Z])",  # except
-        r"^\s*with\s+.*:",  # with statement
-        r"^\s*assert\s+",  # assert
-        r"^\s*yield\s+",  # yield
-        r"^\s*lambda\s+",  # lambda
-        r"^\s*@\w+",  # decorator
-        r"^\s*print\s*\(",  # print call
-        r"^\s*self\.",  # self reference
-        r"^\s*\w+\.\w+\(",  # method call
-        r"^\s*\w+\s*\([^)]*\)\s*$",  # function call
-    ]
-    if not any(re.match(p, text) for p in code_patterns):
+    if not _CODE_RE.match(text):
         return False
     if _looks_like_prose(text):
         return False
     return True
 
 
+@functools.lru_cache(maxsize=4096)
 def is_divider(text: str) -> bool:
     """Check if a comment is a section divider like # ---- or # ====."""
     stripped = text.strip()
-    if len(stripped) < 3:
+    length = len(stripped)
+    if length < 4:
+        return False
+    # Check if it's mostly repeated characters. str.count runs in C, and dividers are
+    # nearly always made of their first character, so try that before the others.
+    min_count = (7 * length + 9) // 10  # ceil(70% of length), in integer arithmetic
+    if stripped.count(stripped[0]) >= min_count:
+        return True
+    # A character filling 70% of the line leaves room for at most 30% others, which caps
+    # the distinct count. Prose blows past that, so skip the per-character counts.
+    distinct = set(stripped)
+    if len(distinct) - 1 > length - min_count:
         return False
-    # Check if it's mostly repeated characters
-    char_counts = {}
-    for c in stripped:
-        char_counts[c] = char_counts.get(c, 0) + 1
-    most_common_count = max(char_counts.values())
-    return most_common_count >= len(stripped) * 0.7 and len(stripped) >= 4
+    return max(map(stripped.count, distinct)) >= min_count
 
 
+@functools.lru_cache(maxsize=4096)
 def is_list_item(text: str) -> bool:
     """Check if a comment line is a list item or bullet point."""
-    list_patterns = [
-        r"^\s*[-*•]\s+",  # bullet points
-        r"^\s*\d+[.)]\s+",  # numbered lists
-        r"^\s*[a-zA-Z][.)]\s+",  # lettered lists
-    ]
-    return any(re.match(p, text) for p in list_patterns)
+    return _LIST_RE.match(text) is not None
 
 
 def is_tool_directive(text: str) -> bool:
     """Check if a comment line is a tool directive (type: ignore, noqa, fmt: off,
     etc.)."""
-    directive_patterns = [
-        r"type:\s*ignore",  # mypy/pyright inline suppression
-        r"noqa(\s*:\s*\S+)?$",  # flake8/ruff lint suppression
-        r"pragma:\s*no\s+(cover|branch)",  # coverage.py
-        r"fmt:\s*(off|on|skip)",  # black/ruff formatter
-        r"isort:\s*(skip|skip_file|split)",  # isort
-        r"pylint:\s*(disable|enable)",  # pylint
-        r"mypy:\s*\S",  # mypy config comments
-        r"pyright:\s*\S",  # pyright config comments
-        r"ruff:\s*noqa",  # ruff-specific suppression
-        r"type:\s*\S+",  # PEP 484 type comments (e.g. type: int)
-    ]
-    stripped = text.strip()
-    return any(re.match(p, stripped) for p in directive_patterns)
+    return _DIRECTIVE_RE.match(text.strip()) is not None
 
 
 def find_inline_comment(line: str) -> int | None:
@@ -246,13 +347,7 @@ def is_todo_marker(
         patterns = DEFAULT_TODO_PATTERNS
     if not patterns:
         return False
-    flags = 0 if case_sensitive else re.IGNORECASE
-    # Sort longest-first to avoid prefix ambiguity
-    for p in sorted(patterns, key=lambda s: len(s), reverse=True):
-        boundary = r"\b" if re.match(r"\w", p[-1:]) else ""
-        if re.match(rf"{re.escape(p)}{boundary}", text.lstrip(), flags):
-            return True
-    return False
+    return _match_todo(text.lstrip(), tuple(patterns), case_sensitive) is not None
 
 
 def is_todo_continuation(text: str) -> bool:
@@ -279,12 +374,9 @@ def extract_todo_marker(
         patterns = DEFAULT_TODO_PATTERNS
     stripped = text.lstrip()
     leading = text[: len(text) - len(stripped)]
-    flags = 0 if case_sensitive else re.IGNORECASE
-    for p in sorted(patterns, key=lambda s: len(s), reverse=True):
-        boundary = r"\b" if re.match(r"\w", p[-1:]) else ""
-        m = re.match(rf"({re.escape(p)}{boundary}\s*:?\s*)(.*)", stripped, flags)
-        if m:
-            return leading + m.group(1), m.group(2)
+    m = _match_todo(stripped, tuple(patterns), case_sensitive)
+    if m:
+        return leading + m.group(1), m.group(2)
     return "", text
 
 
@@ -295,13 +387,8 @@ def extract_list_marker(text: str) -> tuple[str, str]:
     ``("  1. ", "first item")``.  The *marker_prefix* includes any leading whitespace
     (nesting indent).  Returns ``("", text)`` on no match.
     """
-    list_patterns = [
-        r"^(\s*[-*•]\s+)(.*)",  # bullet points
-        r"^(\s*\d+[.)]\s+)(.*)",  # numbered lists
-        r"^(\s*[a-zA-Z][.)]\s+)(.*)",  # lettered lists
-    ]
-    for p in list_patterns:
-        m = re.match(p, text)
+    for regex in _LIST_MARKER_RES:
+        m = regex.match(text)
         if m:
             return m.group(1), m.group(2)
     return "", text
@@ -323,7 +410,7 @@ def _join_comment_lines(lines: list[str]) -> str:
         return ""
     result = lines[0]
     for line in lines[1:]:
-        if re.search(r"[a-zA-Z]-$", result) and line and line[0].isalpha():
+        if _HYPHEN_END_RE.search(result) and line and line[0].isalpha():
             result += line
         elif result and result[-1] in ("(", "["):
             result += line
@@ -334,6 +421,58 @@ def _join_comment_lines(lines: list[str]) -> str:
     return result
 
 
+@functools.lru_cache(maxsize=256)
+def _text_wrapper(
+    width: int, initial_indent: str, subsequent_indent: str
+) -> textwrap.TextWrapper:
+    """Return a shared :class:`textwrap.TextWrapper` for these settings."""
+    return textwrap.TextWrapper(
+        width=width,
+        initial_indent=initial_indent,
+        subsequent_indent=subsequent_indent,
+        break_on_hyphens=False,
+        break_long_words=False,
+    )
+
+
+def _fill(
+    text: str, width: int, initial_indent: str = "", subsequent_indent: str = ""
+) -> list[str]:
+    """Wrap *text* into lines, matching ``textwrap.fill(...).split("\\n")``.
+
+    Hyphens and long words are never broken. Joined comment text is almost always words
+    separated by single spaces, and for that case a greedy pack over ``str.split`` gives
+    the same lines without the ``TextWrapper`` machinery. Anything else (runs of spaces,
+    tabs, other whitespace) goes through a cached :class:`textwrap.TextWrapper`.
+    """
+    words = text.split()
+    if " ".join(words) != text:
+        return _text_wrapper(width, initial_indent, subsequent_indent).wrap(text) or [
+            ""
+        ]
+    if not words:
+        return [""]
+
+    lines = []
+    indent = initial_indent
+    available = width - len(indent)
+    current = [words[0]]
+    current_len = len(words[0])
+    for word in words[1:]:
+        if current_len + 1 + len(word) <= available:
+            current.append(word)
+            current_len += 1 + len(word)
+        else:
+            lines.append(indent + " ".join(current))
+            indent = subsequent_indent
+            available = width - len(indent)
+            current = [word]
+            current_len = len(word)
+    lines.append(indent + " ".join(current))
+    return lines
+
+
+@functools.lru_cache(maxsize=4096)
 def should_preserve_line(text: str) -> bool:
     """Determine if a comment line should be preserved as is."""
     if not text.strip():
@@ -345,69 +484,109 @@ def should_preserve_line(text: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=4096)
+def classify_content(text: str) -> str:
+    """Classify comment *text* by the settings-independent heuristics, in one call.
+
+    Returns ``"blank"``, ``"list"`` (a list item), ``"preserve"`` (code, a divider or a
+    tool directive) or ``"text"`` (anything else, which may still be a TODO marker).
+    """
+    if not text.strip():
+        return "blank"
+    if is_list_item(text):
+        return "list"
+    if should_preserve_line(text) or is_tool_directive(text):
+        return "preserve"
+    return "text"
+
+
 def parse_pragma(line: str) -> str | None:
     """Check if a raw source line is an octowrap pragma.
 
     Returns "off", "on", or None.
     """
-    match = re.match(r"^\s*#\s*octowrap:\s*(off|on)\s*$", line, re.IGNORECASE)
+    match = _PRAGMA_RE.match(line)
     return match.group(1).lower() if match else None
 
 
-def parse_comment_blocks(lines: list[str]) -> list[dict]:
-    """Parse file lines into code sections and comment blocks.
+class Block(NamedTuple):
+    """A run of source lines produced by :func:`parse_comment_blocks`."""
 
-    Returns a list of dicts with:
-    - type: 'code' or 'comment_block'
-    - lines: the original lines
-    - indent: indentation level (for comment blocks)
-    - start_idx: starting line index
-    """
-    result = []
-    i = 0
+    type: str  # "code" or "comment_block"
+    lines: list[str]  # the original lines, endings stripped
+    indent: str = ""  # shared indentation (comment blocks only)
+    start_idx: int = 0  # index of the first line in the file
 
-    while i < len(lines):
-        line = lines[i]
 
-        # Check if this is a pure comment line (not inline)
-        match = re.match(r"^(\s*)#(.*)$", line)
+def _comment_indent(line: str) -> str | None:
+    """Return the indentation of a full-line comment, or ``None`` for any other line."""
+    # Most code lines have no "#" at all; rule them out without copying the line.
+    if "#" not in line:
+        return None
+    stripped = line.lstrip()
+    if stripped.startswith("#"):
+        return line[: len(line) - len(stripped)]
+    return None
 
-        if match and not line.rstrip().startswith("#!"):  # skip shebang
-            # Start of a potential comment block
-            indent = match.group(1)
-            block_lines = []
-            start_idx = i
 
-            while i < len(lines):
-                line = lines[i]
-                match = re.match(r"^(\s*)#(.*)$", line)
-                if match and match.group(1) == indent:
-                    block_lines.append(line)
-                    i += 1
-                else:
-                    break
+def parse_comment_blocks(lines: list[str]) -> list[Block]:
+    """Parse file lines into code sections and comment blocks.
 
+    Returns a list of :class:`Block` tuples, one per run of code lines or comment lines.
+    """
+    # One indent lookup per line up front; the loops below only compare and slice.
+    indents = [_comment_indent(line) for line in lines]
+    result: list[Block] = []
+    i = 0
+    n = len(lines)
+
+    while i < n:
+        indent = indents[i]
+        start_idx = i
+
+        if indent is not None and not lines[i].startswith("#!"):  # skip shebang
+            # Start of a potential comment block. Interned so the many blocks sharing an
+            # indent share one string, and later cache-key compares hit by identity.
+            i += 1
+            while i < n and indents[i] == indent:
+                i += 1
             result.append(
-                {
-                    "type": "comment_block",
-                    "lines": block_lines,
-                    "indent": indent,
-                    "start_idx": start_idx,
-                }
+                Block(
+                    "comment_block", lines[start_idx:i], sys.intern(indent), start_idx
+                )
             )
         else:
-            # Code line or other
-            if result and result[-1]["type"] == "code":
-                result[-1]["lines"].append(line)
-            else:
-                result.append({"type": "code", "lines": [line], "start_idx": i})
+            # Run of code lines (or a shebang) up to the next comment block
             i += 1
+            while i < n and (indents[i] is None or lines[i].startswith("#!")):
+                i += 1
+            result.append(Block("code", lines[start_idx:i], "", start_idx))
 
     return result
 
 
+def _line_kind(
+    content: str,
+    todo_patterns: list[str],
+    todo_case_sensitive: bool,
+    list_wrap: bool,
+) -> str:
+    """Classify one line of comment content for paragraph grouping.
+
+    Returns ``"blank"``, ``"list"``, ``"preserve"``, ``"todo"`` or ``"wrap"``.
+    """
+    kind = classify_content(content)
+    if kind == "list":
+        return "list" if list_wrap else "preserve"
+    if kind == "text":
+        if is_todo_marker(content, todo_patterns, todo_case_sensitive):
+            return "todo"
+        return "wrap"
+    return kind
+
+
 def rewrap_comment_block(
-    block: dict,
+    block: Block,
     max_line_length: int = 88,
     comment_prefix: str = "# ",
     todo_patterns: list[str] | None = None,
@@ -415,13 +594,108 @@ def rewrap_comment_block(
     todo_multiline: bool = True,
     list_wrap: bool = True,
 ) -> list[str]:
-    """Rewrap a comment block to the specified line length."""
-    indent = block["indent"]
-    lines = block["lines"]
+    """Rewrap a comment block to the specified line length.
 
+    Every line of *block* must be a full-line comment at ``block.indent``, as produced
+    by :func:`parse_comment_blocks`.
+
+    Results for multi-line blocks are memoized on the full input, since license headers
+    and other boilerplate comments repeat across the files of a project.
+    """
     if todo_patterns is None:
         todo_patterns = DEFAULT_TODO_PATTERNS
 
+    if len(block.lines) < 2:
+        return _rewrap_lines(
+            block.indent,
+            block.lines,
+            max_line_length,
+            comment_prefix,
+            todo_patterns,
+            todo_case_sensitive,
+            todo_multiline,
+            list_wrap,
+        )
+    return list(
+        _rewrap_lines_cached(
+            block.indent,
+            tuple(block.lines),
+            max_line_length,
+            comment_prefix,
+            tuple(todo_patterns),
+            todo_case_sensitive,
+            todo_multiline,
+            list_wrap,
+        )
+    )
+
+
+@functools.lru_cache(maxsize=2048)
+def _rewrap_lines_cached(
+    indent: str,
+    lines: tuple[str, ...],
+    max_line_length: int,
+    comment_prefix: str,
+    todo_patterns: tuple[str, ...],
+    todo_case_sensitive: bool,
+    todo_multiline: bool,
+    list_wrap: bool,
+) -> tuple[str, ...]:
+    """Memoized :func:`_rewrap_lines` over hashable arguments."""
+    return tuple(
+        _rewrap_lines(
+            indent,
+            list(lines),
+            max_line_length,
+            comment_prefix,
+            list(todo_patterns),
+            todo_case_sensitive,
+            todo_multiline,
+            list_wrap,
+        )
+    )
+
+
+def _wrap_marked(
+    prefix: str,
+    marker_prefix: str,
+    first_content: str,
+    contents: list[str],
+    hanging: str,
+    max_line_length: int,
+) -> list[str]:
+    """Rewrap a TODO or list item behind its marker, continuing under *hanging*.
+
+    *contents* are the item's comment contents, first line included, and
+    *first_content* is the first line with the marker removed. The original lines are
+    kept when there is no text after the marker or too little room to wrap.
+    """
+    parts = [first_content] + [c.strip() for c in contents[1:]]
+    full_text = _join_comment_lines(parts).strip()
+
+    initial = prefix + marker_prefix
+    subsequent = prefix + hanging
+    # No content after the marker (e.g. "# TODO:" or a bare "# -"), or too narrow.
+    if (
+        not full_text
+        or max_line_length - len(initial) < 10
+        or max_line_length - len(subsequent) < 10
+    ):
+        return [prefix + content for content in contents]
+    return _fill(full_text, max_line_length, initial, subsequent)
+
+
+def _rewrap_lines(
+    indent: str,
+    lines: list[str],
+    max_line_length: int,
+    comment_prefix: str,
+    todo_patterns: list[str],
+    todo_case_sensitive: bool,
+    todo_multiline: bool,
+    list_wrap: bool,
+) -> list[str]:
+    """Rewrap the comment *lines* of a block at *indent*; see rewrap_comment_block."""
     # Calculate available width for text
     prefix = indent + comment_prefix
     text_width = max_line_length - len(prefix)
@@ -430,168 +704,118 @@ def rewrap_comment_block(
         # Too narrow to rewrap meaningfully
         return lines
 
-    # Extract comment content
+    # Extract comment content. Every line is *indent* + "#" + text, so slice off the
+    # indent and the "#", then at most one whitespace character after it.
+    start = len(indent) + 1
     contents = []
     for line in lines:
-        match = re.match(r"^\s*#\s?(.*)$", line)
-        if match:
-            contents.append(match.group(1))
+        content = line[start:]
+        if content[:1].isspace():
+            content = content[1:]
+        contents.append(content)
+
+    # Skip grouping and wrapping for blocks that would come back unchanged. A lone line
+    # already in "# text" form with single spaces that fits the width is re-emitted as
+    # is by every branch below, as is a block made only of blank and preserved lines.
+    if len(lines) == 1:
+        content = contents[0]
+        if (
+            content
+            and len(lines[0]) <= max_line_length
+            and prefix + content == lines[0]
+            and " ".join(content.split()) == content
+        ):
+            return lines
+
+    # Classify every line once; the fast path and the grouping loop below both read
+    # these instead of re-running the heuristics per check.
+    kinds = [
+        _line_kind(content, todo_patterns, todo_case_sensitive, list_wrap)
+        for content in contents
+    ]
+
+    if len(lines) > 1:
+        blank = indent + "#"
+        for line, content, kind in zip(lines, contents, kinds):
+            if kind == "blank" and line == blank:
+                continue
+            if kind != "preserve" or line != prefix + content:
+                break
         else:
-            # Defensive: parse_comment_blocks only yields # lines, so the regex above
-            # will always match.
-            contents.append("")  # pragma: no cover
+            return lines
 
-    # Group into paragraphs (separated by blank comment lines or preserved lines)
-    paragraphs: list[tuple[str, list[str]]] = []
+    # Group into paragraphs (separated by blank comment lines or preserved lines) and
+    # emit each one as soon as it ends.
+    result: list[str] = []
     current_para: list[str] = []
     i = 0
 
     while i < len(contents):
         content = contents[i]
-        if not content.strip():
-            # Blank line: end current paragraph
-            if current_para:
-                paragraphs.append(("wrap", current_para))
-                current_para = []
-            paragraphs.append(("blank", [""]))
-        elif is_list_item(content) and list_wrap:
-            # Flush current paragraph
-            if current_para:
-                paragraphs.append(("wrap", current_para))
-                current_para = []
-            marker_prefix, _ = extract_list_marker(content)
-            cont_indent_len = len(marker_prefix)
+        kind = kinds[i]
+        if kind == "wrap":
+            current_para.append(content)
+            i += 1
+            continue
+
+        # Every other kind ends the current paragraph.
+        if current_para:
+            text = _join_comment_lines(current_para)
+            result.extend([prefix + line for line in _fill(text, text_width)])
+            current_para = []
+
+        if kind == "blank":
+            result.append(indent + "#")
+        elif kind == "preserve":
+            # Never empty: blank content is classified as "blank" above.
+            result.append(prefix + content)
+        elif kind == "list":
+            marker_prefix, first_content = extract_list_marker(content)
             list_lines = [content]
-            # Collect continuation lines (indented to at least text-start column)
-            while i + 1 < len(contents):
+            # Collect continuation lines: plain prose indented to at least the
+            # text-start column. Sibling or nested items start their own paragraph.
+            while i + 1 < len(contents) and kinds[i + 1] == "wrap":
                 next_content = contents[i + 1]
-                if not next_content.strip():
-                    break
-                if is_list_item(next_content):
-                    break  # sibling or nested item — its own paragraph
-                if (
-                    should_preserve_line(next_content)
-                    or is_tool_directive(next_content)
-                    or is_todo_marker(next_content, todo_patterns, todo_case_sensitive)
-                ):
-                    break
                 actual_indent = len(next_content) - len(next_content.lstrip())
-                if actual_indent >= cont_indent_len:
-                    i += 1
-                    list_lines.append(contents[i])
-                else:
+                if actual_indent < len(marker_prefix):
                     break
-            paragraphs.append(("list", list_lines))
-        elif (
-            should_preserve_line(content)
-            or is_list_item(content)
-            or is_tool_directive(content)
-        ):
-            # Preserve this line as is
-            if current_para:
-                paragraphs.append(("wrap", current_para))
-                current_para = []
-            paragraphs.append(("preserve", [content]))
-        elif is_todo_marker(content, todo_patterns, todo_case_sensitive):
-            # Flush current paragraph
-            if current_para:
-                paragraphs.append(("wrap", current_para))
-                current_para = []
+                i += 1
+                list_lines.append(next_content)
+            result.extend(
+                _wrap_marked(
+                    prefix,
+                    marker_prefix,
+                    first_content,
+                    list_lines,
+                    " " * len(marker_prefix),
+                    max_line_length,
+                )
+            )
+        else:  # todo
+            marker_prefix, first_content = extract_todo_marker(
+                content, todo_patterns, todo_case_sensitive
+            )
             # Collect TODO + continuation lines
             todo_lines = [content]
             if todo_multiline:
                 while i + 1 < len(contents) and is_todo_continuation(contents[i + 1]):
                     i += 1
                     todo_lines.append(contents[i])
-            paragraphs.append(("todo", todo_lines))
-        else:
-            current_para.append(content)
+            result.extend(
+                _wrap_marked(
+                    prefix,
+                    marker_prefix,
+                    first_content,
+                    todo_lines,
+                    " ",
+                    max_line_length,
+                )
+            )
         i += 1
 
     if current_para:
-        paragraphs.append(("wrap", current_para))
-
-    # Rewrap and reconstruct
-    result = []
-    for para_type, para_contents in paragraphs:
-        if para_type == "blank":
-            result.append(indent + "#")
-        elif para_type == "preserve":
-            for content in para_contents:
-                if content:
-                    result.append(prefix + content)
-                else:
-                    # Defensive: preserved lines always have non-empty content since
-                    # blank lines are handled above.
-                    result.append(indent + "#")  # pragma: no cover
-        elif para_type == "todo":
-            marker_prefix, first_content = extract_todo_marker(
-                para_contents[0], todo_patterns, todo_case_sensitive
-            )
-            # Join first-line content + stripped continuation lines
-            parts = [first_content] + [c.strip() for c in para_contents[1:]]
-            full_text = _join_comment_lines(parts).strip()
-
-            # If there is no content after the TODO marker (e.g. "# TODO:"), preserve
-            # the original lines instead of emitting a blank line.
-            if not full_text:
-                for content in para_contents:
-                    result.append(prefix + content)
-            else:
-                initial = prefix + marker_prefix
-                subsequent = prefix + " "
-                first_width = max_line_length - len(initial)
-                cont_width = max_line_length - len(subsequent)
-
-                if first_width < 10 or cont_width < 10:
-                    # Too narrow — preserve as-is
-                    for content in para_contents:
-                        result.append(prefix + content)
-                else:
-                    wrapped = textwrap.fill(
-                        full_text,
-                        width=max_line_length,
-                        initial_indent=initial,
-                        subsequent_indent=subsequent,
-                        break_on_hyphens=False,
-                        break_long_words=False,
-                    )
-                    result.extend(wrapped.split("\n"))
-        elif para_type == "list":
-            marker_prefix, first_content = extract_list_marker(para_contents[0])
-            parts = [first_content] + [c.strip() for c in para_contents[1:]]
-            full_text = _join_comment_lines(parts).strip()
-
-            if not full_text:
-                # Bare marker with no content (e.g. "# -") — preserve
-                for content in para_contents:
-                    result.append(prefix + content)
-            else:
-                initial = prefix + marker_prefix
-                subsequent = prefix + " " * len(marker_prefix)
-                first_width = max_line_length - len(initial)
-                cont_width = max_line_length - len(subsequent)
-
-                if first_width < 10 or cont_width < 10:
-                    for content in para_contents:
-                        result.append(prefix + content)
-                else:
-                    wrapped = textwrap.fill(
-                        full_text,
-                        width=max_line_length,
-                        initial_indent=initial,
-                        subsequent_indent=subsequent,
-                        break_on_hyphens=False,
-                        break_long_words=False,
-                    )
-                    result.extend(wrapped.split("\n"))
-        else:  # wrap
-            text = _join_comment_lines(para_contents)
-            wrapped = textwrap.fill(
-                text, width=text_width, break_on_hyphens=False, break_long_words=False
-            )
-            for wrapped_line in wrapped.split("\n"):
-                result.append(prefix + wrapped_line)
+        text = _join_comment_lines(current_para)
+        result.extend([prefix + line for line in _fill(text, text_width)])
 
     return result
 
@@ -607,6 +831,28 @@ def _should_extract_inline(line: str, max_line_length: int) -> bool:
     return not is_tool_directive(comment_text)
 
 
+def _split_lines(content: str) -> list[str]:
+    """Split *content* on ``\\r\\n``, ``\\r`` and ``\\n`` only, dropping the endings.
+
+    Unlike :meth:`str.splitlines`, form feeds and other Unicode line boundaries stay part
+    of their line, as they do for the Python tokenizer.
+    """
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    lines = content.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _line_ending(content: str) -> str:
+    """Return the line ending that terminates the first line of *content*."""
+    cr = content.find("\r")
+    if cr == -1 or content.find("\n", 0, cr) != -1:
+        return "\n"
+    return "\r\n" if content.startswith("\r\n", cr) else "\r"
+
+
 def count_changed_blocks(
     content: str,
     max_line_length: int = 88,
@@ -623,26 +869,28 @@ def count_changed_blocks(
     are traversed here solely to track the ``disabled`` state.  When *inline* is
     ``True``, overflowing inline comments also contribute to the count.
     """
-    lines_stripped = [line.rstrip("\n\r") for line in content.splitlines(keepends=True)]
-    blocks = parse_comment_blocks(lines_stripped)
+    if "#" not in content:
+        return 0
+
+    blocks = parse_comment_blocks(_split_lines(content))
     count = 0
     disabled = False
 
     for block in blocks:
-        if block["type"] == "code":
+        if block.type == "code":
             if not disabled and inline:
-                for line in block["lines"]:
+                for line in block.lines:
                     if _should_extract_inline(line, max_line_length):
                         count += 1
             continue
 
-        has_pragma = any(parse_pragma(bline) is not None for bline in block["lines"])
+        # One parse per line, reused below; "off" and "on" are both truthy.
+        pragmas = [parse_pragma(bline) for bline in block.lines]
 
-        if has_pragma:
+        if any(pragmas):
             # Pragma blocks are auto-applied, not interactively prompted.  Walk the
-            # lines only to update the disabled state.
-            for bline in block["lines"]:
-                p = parse_pragma(bline)
+            # pragmas only to update the disabled state.
+            for p in pragmas:
                 if p is not None:
                     disabled = p == "off"
             continue
@@ -658,7 +906,7 @@ def count_changed_blocks(
             todo_multiline=todo_multiline,
             list_wrap=list_wrap,
         )
-        if rewrapped != block["lines"]:
+        if rewrapped != block.lines:
             count += 1
 
     return count
@@ -666,21 +914,22 @@ def count_changed_blocks(
 
 _USE_COLOR: bool = True
 
+_COLORS: dict[str, str] = {
+    "red": "\033[91m",
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "cyan": "\033[96m",
+    "magenta": "\033[95m",
+    "reset": "\033[0m",
+    "bold": "\033[1m",
+}
+
 
 def colorize(text: str, color: str) -> str:
     """Add ANSI color codes to text."""
     if not _USE_COLOR:
         return text
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "cyan": "\033[96m",
-        "magenta": "\033[95m",
-        "reset": "\033[0m",
-        "bold": "\033[1m",
-    }
-    return f"{colors.get(color, '')}{text}{colors['reset']}"
+    return f"{_COLORS.get(color, '')}{text}{_COLORS['reset']}"
 
 
 def show_block_diff(
@@ -704,15 +953,13 @@ def show_block_diff(
         header = colorize(f"Lines {start_line + 1}-{end}:", "bold")
     if progress:
         header += " " + colorize(progress, "cyan")
-    print(f"\n{header}")
-    print(colorize("─" * 60, "cyan"))
-
-    for line in original_lines:
-        print(colorize(f"- {line}", "red"))
-    for line in new_lines:
-        print(colorize(f"+ {line}", "green"))
-
-    print(colorize("─" * 60, "cyan"))
+    rule = colorize("─" * 60, "cyan")
+    out = ["", header, rule]
+    out.extend([colorize(f"- {line}", "red") for line in original_lines])
+    out.extend([colorize(f"+ {line}", "green") for line in new_lines])
+    out.append(rule)
+    # One write for the whole block rather than a print per line.
+    sys.stdout.write("\n".join(out) + "\n")
     return True
 
 
@@ -788,12 +1035,11 @@ def process_content(
     Returns (changed, new_content).  When *_state* is a dict and the user presses quit
     in interactive mode, ``_state["quit"]`` is set to ``True``.
     """
-    lines = content.splitlines(keepends=True)
-
-    # Normalize line endings for processing
-    lines_stripped = [line.rstrip("\n\r") for line in lines]
+    # Without a "#" there are no comments to rewrap; skip splitting and parsing.
+    if "#" not in content:
+        return False, content
 
-    blocks = parse_comment_blocks(lines_stripped)
+    blocks = parse_comment_blocks(_split_lines(content))
 
     new_lines = []
     user_quit = False
@@ -801,9 +1047,11 @@ def process_content(
     disabled = False
 
     for block in blocks:
-        if block["type"] == "code":
-            if not disabled and inline:
-                for line_idx, line in enumerate(block["lines"]):
+        if block.type == "code":
+            # Only lines over the limit can have an inline comment extracted, so a run
+            # of code that fits is copied through in one extend.
+            if not disabled and inline and max(map(len, block.lines)) > max_line_length:
+                for line_idx, line in enumerate(block.lines):
                     if user_quit:
                         new_lines.append(line)
                         continue
@@ -824,12 +1072,12 @@ def process_content(
                         new_lines.append(line)
                         continue
                     indent = " " * (len(line) - len(line.lstrip()))
-                    synthetic = {
-                        "type": "comment_block",
-                        "lines": [f"{indent}# {comment_text}"],
-                        "indent": indent,
-                        "start_idx": block["start_idx"] + line_idx,
-                    }
+                    synthetic = Block(
+                        "comment_block",
+                        [f"{indent}# {comment_text}"],
+                        indent,
+                        block.start_idx + line_idx,
+                    )
                     wrapped_comment = rewrap_comment_block(
                         synthetic,
                         max_line_length,
@@ -859,7 +1107,7 @@ def process_content(
                         has_changes = show_block_diff(
                             [line],
                             replacement,
-                            block["start_idx"] + line_idx,
+                            block.start_idx + line_idx,
                             filepath=filepath,
                             progress=progress,
                         )
@@ -884,15 +1132,11 @@ def process_content(
                                     " (flagged using octowrap in"
                                     " interactive mode)."
                                 )
-                                wrapped = textwrap.fill(
-                                    flag_text,
-                                    width=max_line_length,
-                                    initial_indent=initial,
-                                    subsequent_indent=subsequent,
-                                    break_on_hyphens=False,
-                                    break_long_words=False,
+                                new_lines.extend(
+                                    _fill(
+                                        flag_text, max_line_length, initial, subsequent
+                                    )
                                 )
-                                new_lines.extend(wrapped.split("\n"))
                                 new_lines.append(line)
                             elif action == "q":
                                 user_quit = True
@@ -906,29 +1150,25 @@ def process_content(
                             # (1 -> 2+), so this branch is unreachable in practice.
                             new_lines.append(line)  # pragma: no cover
             else:
-                new_lines.extend(block["lines"])
+                new_lines.extend(block.lines)
             continue
 
-        # Check if this block contains any pragma directives
-        has_pragma = any(parse_pragma(bline) is not None for bline in block["lines"])
+        # One parse per line, reused below; "off" and "on" are both truthy.
+        pragmas = [parse_pragma(bline) for bline in block.lines]
 
-        if has_pragma:
+        if any(pragmas):
             # Split the block into sub blocks at pragma boundaries, processing each
             # segment according to the current disabled state.
             segment_lines: list[str] = []
-            segment_start = block["start_idx"]
+            segment_start = block.start_idx
 
-            for bline in block["lines"]:
-                p = parse_pragma(bline)
+            for bline, p in zip(block.lines, pragmas):
                 if p is not None:
                     # Process accumulated segment before this pragma.
                     if segment_lines:
-                        sub = {
-                            "type": "comment_block",
-                            "lines": segment_lines,
-                            "indent": block["indent"],
-                            "start_idx": segment_start,
-                        }
+                        sub = Block(
+                            "comment_block", segment_lines, block.indent, segment_start
+                        )
                         if disabled:
                             new_lines.extend(segment_lines)
                         else:
@@ -953,12 +1193,7 @@ def process_content(
 
             # Process any remaining segment after the last pragma.
             if segment_lines:
-                sub = {
-                    "type": "comment_block",
-                    "lines": segment_lines,
-                    "indent": block["indent"],
-                    "start_idx": segment_start,
-                }
+                sub = Block("comment_block", segment_lines, block.indent, segment_start)
                 if disabled:
                     new_lines.extend(segment_lines)
                 else:
@@ -976,7 +1211,7 @@ def process_content(
 
         if disabled:
             # Rewrapping is suppressed, so preserve as is.
-            new_lines.extend(block["lines"])
+            new_lines.extend(block.lines)
             continue
 
         # Use the normal rewrap logic.
@@ -1005,9 +1240,9 @@ def process_content(
                 progress = f"[{_state['block_current']}/{_state['block_total']}]"
 
             has_changes = not user_quit and show_block_diff(
-                block["lines"],
+                block.lines,
                 rewrapped,
-                block["start_idx"],
+                block.start_idx,
                 filepath=filepath,
                 progress=progress,
             )
@@ -1025,46 +1260,34 @@ def process_content(
                 elif action == "a":
                     new_lines.extend(rewrapped)
                 elif action == "e":
-                    indent = block["indent"]
+                    indent = block.indent
                     new_lines.append(f"{indent}# octowrap: off")
-                    new_lines.extend(block["lines"])
+                    new_lines.extend(block.lines)
                     new_lines.append(f"{indent}# octowrap: on")
                 elif action == "f":
-                    indent = block["indent"]
+                    indent = block.indent
                     initial = f"{indent}# FIXME: "
                     subsequent = f"{indent}#  "
                     flag_text = (
                         "Manually fix the below comment"
                         " (flagged using octowrap in interactive mode)."
                     )
-                    wrapped = textwrap.fill(
-                        flag_text,
-                        width=max_line_length,
-                        initial_indent=initial,
-                        subsequent_indent=subsequent,
-                        break_on_hyphens=False,
-                        break_long_words=False,
+                    new_lines.extend(
+                        _fill(flag_text, max_line_length, initial, subsequent)
                     )
-                    new_lines.extend(wrapped.split("\n"))
-                    new_lines.extend(block["lines"])
+                    new_lines.extend(block.lines)
                 elif action == "q":
                     user_quit = True
                     if _state is not None:
                         _state["quit"] = True
-                    new_lines.extend(block["lines"])
+                    new_lines.extend(block.lines)
                 else:  # skip
-                    new_lines.extend(block["lines"])
+                    new_lines.extend(block.lines)
             else:
-                new_lines.extend(block["lines"])
+                new_lines.extend(block.lines)
 
     # Restore the original line ending style.
-    if lines and lines[0].endswith("\r\n"):
-        ending = "\r\n"
-    elif lines and lines[0].endswith("\r"):
-        ending = "\r"
-    else:
-        ending = "\n"
-
+    ending = _line_ending(content)
     new_content = ending.join(new_lines)
     if content.endswith(("\n", "\r")):
         new_content += ending
@@ -1082,6 +1305,12 @@ def _relative_path(filepath: Path) -> Path:
         return filepath
 
 
+def _read_source(filepath: Path) -> str:
+    """Read *filepath* as UTF-8 with its line endings left exactly as on disk."""
+    with open(filepath, "rb") as f:
+        return f.read().decode("utf-8")
+
+
 def process_file(
     filepath: Path,
     max_line_length: int = 88,
@@ -1093,20 +1322,27 @@ def process_file(
     todo_multiline: bool = True,
     inline: bool = True,
     list_wrap: bool = True,
+    content: str | None = None,
 ) -> tuple[bool, str]:
     """Process a single file, rewrapping comment blocks.
 
+    When the caller already holds the file's text (read as UTF-8 with ``newline=""``)
+    it can pass it as *content* to skip reading the file again.
+
     Returns (changed, new_content).
     """
-    with open(filepath, encoding="utf-8", newline="") as f:
-        content = f.read()
+    if content is None:
+        content = _read_source(filepath)
 
+    interactive = interactive and not dry_run
     changed, new_content = process_content(
         content,
         max_line_length,
-        interactive=interactive and not dry_run,
+        interactive=interactive,
         _state=_state,
-        filepath=str(_relative_path(filepath)),
+        # The display path is only shown in interactive diffs; resolving it costs
+        # several syscalls per file, so batch runs skip it.
+        filepath=str(_relative_path(filepath)) if interactive else "",
         todo_patterns=todo_patterns,
         todo_case_sensitive=todo_case_sensitive,
         todo_multiline=todo_multiline,
@@ -1116,6 +1352,9 @@ def process_file(
 
     if changed and not dry_run:
         original_mode = stat.S_IMODE(os.stat(filepath).st_mode)
+        # Imported here: only runs that write files need it, and it is slow to import.
+        import tempfile
+
         tmp_fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, suffix=".tmp")
         try:
             with open(tmp_fd, "w", encoding="utf-8", newline="") as f:
@@ -1132,7 +1371,113 @@ def process_file(
     return changed, new_content
 
 
-def main():
+def _process_file_texts(filepath: Path, **kwargs) -> tuple[bool, str, str]:
+    """Run :func:`process_file` on *filepath*, returning ``(changed, original, new)``.
+
+    The texts are only returned for changed files; unchanged ones give empty strings,
+    so pool workers don't send back file contents nobody will look at.
+    """
+    original = _read_source(filepath)
+    changed, new_content = process_file(filepath, content=original, **kwargs)
+    if not changed:
+        return False, "", ""
+    return True, original, new_content
+
+
+def _walk_py_files(
+    root: Path, recursive: bool, exclude: re.Pattern[str]
+) -> Iterator[Path]:
+    """Yield the ``.py`` files under *root*, depth first.
+
+    Uses :func:`os.scandir` so file and directory checks come from the directory listing
+    itself rather than a ``stat`` per entry. Entries whose name matches *exclude* are
+    skipped, so excluded directories are never listed. Symlinked directories are not
+    descended into, matching ``Path.rglob``; unreadable directories are skipped.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if exclude.match(os.path.normcase(entry.name)):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirs.append(Path(entry.path))
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        files.append(Path(entry.path))
+        except OSError:
+            continue
+        yield from files
+        stack.extend(reversed(subdirs))
+
+
+def _iter_files(
+    paths: list[Path], recursive: bool, exclude_patterns: list[str]
+) -> Iterator[Path]:
+    """Return an iterator over the ``.py`` files named by *paths*.
+
+    The paths themselves are checked right away, so a missing one is reported before
+    any file is processed. Directories are walked lazily as they are reached, so
+    processing starts with the first file instead of after the whole tree is listed.
+    """
+    roots: list[tuple[Path, bool]] = []
+    for path in paths:
+        if path.is_file():
+            roots.append((path, False))
+        elif path.is_dir():
+            roots.append((path, True))
+        else:
+            print(f"Warning: {path} not found, skipping")
+    return _walk_roots(roots, recursive, exclude_patterns)
+
+
+def _walk_roots(
+    roots: list[tuple[Path, bool]], recursive: bool, exclude_patterns: list[str]
+) -> Iterator[Path]:
+    """Yield the files for the ``(path, is_dir)`` *roots* checked by :func:`_iter_files`."""
+    exclude = _exclude_regex(tuple(exclude_patterns))
+    for path, is_dir in roots:
+        if not is_dir:
+            yield path
+        # An excluded component in the directory given on the command line excludes
+        # everything under it; below that, the walk prunes by entry name.
+        elif not is_excluded(path, exclude_patterns):
+            yield from _walk_py_files(path, recursive, exclude)
+
+
+def _submit_to_pool(
+    run: Callable[[Path], tuple[bool, str, str]], files: Iterable[Path], workers: int
+) -> Generator[tuple[Path, "Future[tuple[bool, str, str]]"]]:
+    """Run *run* over *files* in a pool of *workers* processes, yielding ``(path,
+    future)`` in order.
+
+    Only a bounded window of files is in flight at once, so neither the file list nor
+    the rewritten contents pile up in memory ahead of the consumer.
+    """
+    # Imported here so serial runs don't pay for loading multiprocessing at startup.
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    window = 4 * workers
+    pending: collections.deque[tuple[Path, Future[tuple[bool, str, str]]]] = (
+        collections.deque()
+    )
+    try:
+        for fp in files:
+            pending.append((fp, executor.submit(run, fp)))
+            if len(pending) >= window:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Rewrap # block comments to a specified line width."
     )
@@ -1180,6 +1525,13 @@ def main():
         default=None,
         help="Disable extraction of overflowing inline comments",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, 1 disables parallelism)",
+    )
 
     parser.add_argument(
         "--config",
@@ -1209,7 +1561,7 @@ def main():
         help="Disable colored output",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Resolve color setting: --color -> on, --no-color -> off, neither -> auto detect.
     global _USE_COLOR
@@ -1281,6 +1633,12 @@ def main():
         )
         raise SystemExit(1)
 
+    if args.jobs is None:
+        args.jobs = os.cpu_count() or 1
+    elif args.jobs < 1:
+        print("octowrap: error: --jobs must be at least 1", file=sys.stderr)
+        raise SystemExit(1)
+
     if stdin_mode:
         if len(args.paths) > 1:
             print(
@@ -1323,23 +1681,7 @@ def main():
 
         raise SystemExit(0)
 
-    files_to_process = []
-    for path in args.paths:
-        if path.is_file():
-            files_to_process.append(path)
-        elif path.is_dir():
-            if args.recursive:
-                files_to_process.extend(
-                    p
-                    for p in path.rglob("*.py")
-                    if not is_excluded(p, exclude_patterns)
-                )
-            else:
-                files_to_process.extend(
-                    p for p in path.glob("*.py") if not is_excluded(p, exclude_patterns)
-                )
-        else:
-            print(f"Warning: {path} not found, skipping")
+    files: Iterable[Path] = _iter_files(args.paths, args.recursive, exclude_patterns)
 
     changed_count = 0
     error_count = 0
@@ -1347,8 +1689,10 @@ def main():
 
     # Pre-scan to count total changed blocks for interactive progress indicator.
     if args.interactive and not args.dry_run:
+        # The total needs every file up front, so the walk can't stream here.
+        files = list(files)
         total_blocks = 0
-        for fp in files_to_process:
+        for fp in files:
             try:
                 file_content = fp.read_text(encoding="utf-8")
                 total_blocks += count_changed_blocks(
@@ -1365,46 +1709,66 @@ def main():
         interactive_state["block_total"] = total_blocks
         interactive_state["block_current"] = 0
 
-    for filepath in files_to_process:
-        try:
-            original: str | None = (
-                filepath.read_text(encoding="utf-8") if args.diff else None
-            )
-            changed, new_content = process_file(
-                filepath,
-                args.line_length,
-                dry_run=args.dry_run,
-                interactive=args.interactive,
-                _state=interactive_state,
-                todo_patterns=todo_patterns,
-                todo_case_sensitive=todo_case_sensitive,
-                todo_multiline=todo_multiline,
-                inline=args.inline,
-                list_wrap=list_wrap,
-            )
+    run = functools.partial(
+        _process_file_texts,
+        max_line_length=args.line_length,
+        dry_run=args.dry_run,
+        todo_patterns=todo_patterns,
+        todo_case_sensitive=todo_case_sensitive,
+        todo_multiline=todo_multiline,
+        inline=args.inline,
+        list_wrap=list_wrap,
+    )
 
-            if changed:
-                changed_count += 1
-                if args.diff:
-                    assert type(original) is str
+    # Files are independent, so non-interactive runs over enough of them fan out across
+    # --jobs processes. Results are still consumed in input order, keeping output
+    # identical to a serial run.
+    jobs: Generator[tuple[Path, Future[tuple[bool, str, str]] | None]]
+    if args.interactive or args.jobs == 1:
+        jobs = ((fp, None) for fp in files)
+    else:
+        files = iter(files)
+        head = list(itertools.islice(files, _PARALLEL_MIN_FILES))
+        if len(head) < _PARALLEL_MIN_FILES:
+            jobs = ((fp, None) for fp in head)
+        else:
+            jobs = _submit_to_pool(run, itertools.chain(head, files), args.jobs)
 
-                    diff = difflib.unified_diff(
-                        original.splitlines(keepends=True),
-                        new_content.splitlines(keepends=True),
-                        fromfile=str(filepath),
-                        tofile=str(filepath),
+    try:
+        for filepath, future in jobs:
+            try:
+                if future is None:
+                    changed, original, new_content = run(
+                        filepath, interactive=args.interactive, _state=interactive_state
                     )
-                    print("".join(diff))
-                elif args.dry_run:
-                    print(f"Would reformat: {filepath}")
                 else:
-                    print(f"Reformatted: {filepath}")
-        except Exception as e:
-            print(f"error: Failed to process {filepath}: {e}", file=sys.stderr)
-            error_count += 1
+                    changed, original, new_content = future.result()
+
+                if changed:
+                    changed_count += 1
+                    if args.diff:
+                        # The original comes back with the result, so the diff compares
+                        # against exactly what was rewrapped.
+                        diff = difflib.unified_diff(
+                            original.splitlines(keepends=True),
+                            new_content.splitlines(keepends=True),
+                            fromfile=str(filepath),
+                            tofile=str(filepath),
+                        )
+                        print("".join(diff))
+                    elif args.dry_run:
+                        print(f"Would reformat: {filepath}")
+                    else:
+                        print(f"Reformatted: {filepath}")
+            except Exception as e:
+                print(f"error: Failed to process {filepath}: {e}", file=sys.stderr)
+                error_count += 1
 
-        if interactive_state.get("quit"):
-            break
+            if interactive_state.get("quit"):
+                break
+    finally:
+        # Shut the pool down promptly if the loop exits early.
+        jobs.close()
 
     action = "would be reformatted" if args.dry_run else "reformatted"
     print(f"\n{changed_count} file(s) {action}.")
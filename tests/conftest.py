@@ -1,6 +1,15 @@
+import pytest
+
+import octowrap.rewrap as mod
+from octowrap.rewrap import Block
+
+
+@pytest.fixture(autouse=True)
+def _restore_use_color(monkeypatch):
+    """Undo main()'s write to the module-level _USE_COLOR flag after each test."""
+    monkeypatch.setattr(mod, "_USE_COLOR", mod._USE_COLOR)
+
+
 def make_block(lines, indent=""):
-    """Build a comment block dict for use with rewrap_comment_block."""
-    return {
-        "indent": indent,
-        "lines": lines,
-    }
+    """Build a comment Block for use with rewrap_comment_block."""
+    return Block("comment_block", lines, indent)
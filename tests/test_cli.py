@@ -1,6 +1,7 @@
+import importlib.metadata
 import io
 import runpy
-import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -16,16 +17,32 @@ WRAPPABLE_CONTENT = (
 )
 # fmt: on
 
+STDIN_DIRTY = "# This is a comment that was wrapped\n# at a short width previously.\n"
+
+
+@pytest.fixture
+def stdin_buf(monkeypatch):
+    """Patch sys.stdin with one StringIO and return a setter for its contents."""
+    buf = io.StringIO()
+    monkeypatch.setattr("sys.stdin", buf)
+
+    def _set(text):
+        buf.seek(0)
+        buf.truncate()
+        buf.write(text)
+        buf.seek(0)
+
+    return _set
+
 
 class TestMain:
     """Tests for the main() CLI orchestration function."""
 
-    def test_default_non_interactive(self, tmp_path, monkeypatch, capsys):
+    def test_default_non_interactive(self, tmp_path, capsys):
         """By default, changes are applied without prompting."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         out = capsys.readouterr().out
         assert "Reformatted:" in out
         assert "1 file(s) reformatted." in out
@@ -34,80 +51,116 @@ class TestMain:
         """With -i, the user is prompted per block."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(f)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(f)])
         out = capsys.readouterr().out
         assert "1 file(s) reformatted." in out
 
-    def test_dry_run(self, tmp_path, monkeypatch, capsys):
+    def test_dry_run(self, tmp_path, capsys):
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--dry-run", str(f)])
-        main()
+        main(["--dry-run", str(f)])
         out = capsys.readouterr().out
         assert "Would reformat:" in out
         assert "would be reformatted" in out
         # File should not have been modified
         assert f.read_bytes() == WRAPPABLE_CONTENT
 
-    def test_diff_output(self, tmp_path, monkeypatch, capsys):
+    def test_diff_output(self, tmp_path, capsys):
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--diff", str(f)])
-        main()
+        main(["--diff", str(f)])
         out = capsys.readouterr().out
         assert "---" in out
         assert "+++" in out
         # --diff implies --dry-run
         assert f.read_bytes() == WRAPPABLE_CONTENT
 
-    def test_no_changes(self, tmp_path, monkeypatch, capsys):
+    def test_no_changes(self, tmp_path, capsys):
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         out = capsys.readouterr().out
         assert "0 file(s) reformatted." in out
 
-    def test_custom_line_length(self, tmp_path, monkeypatch, capsys):
+    def test_custom_line_length(self, tmp_path):
         f = tmp_path / "a.py"
         f.write_bytes(
             b"# A moderately long comment that fits at 120 but not at 40.\nx = 1\n"
         )
-        monkeypatch.setattr("sys.argv", ["octowrap", "-l", "40", str(f)])
-        main()
+        main(["-l", "40", str(f)])
         content = f.read_text()
         assert all(len(line) <= 40 for line in content.splitlines())
 
-    def test_missing_path_warns(self, tmp_path, monkeypatch, capsys):
+    def test_missing_path_warns(self, tmp_path, capsys):
         fake = tmp_path / "nonexistent.py"
-        monkeypatch.setattr("sys.argv", ["octowrap", str(fake)])
-        main()
+        main([str(fake)])
         out = capsys.readouterr().out
         assert "not found, skipping" in out
 
-    def test_directory_non_recursive(self, tmp_path, monkeypatch, capsys):
-        """With --no-recursive, only top level .py files are processed."""
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_missing_path_warns_before_processing(
+        self, jobs, tmp_path, monkeypatch, capsys
+    ):
+        """Missing paths are reported before any file's output, as a batch."""
+        monkeypatch.setattr(mod, "_PARALLEL_MIN_FILES", 2)
+        a = tmp_path / "a.py"
+        b = tmp_path / "b.py"
+        a.write_bytes(WRAPPABLE_CONTENT)
+        b.write_bytes(WRAPPABLE_CONTENT)
+        missing = tmp_path / "missing.py"
+        main(["-j", jobs, str(a), str(missing), str(b)])
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[:3] == [
+            f"Warning: {missing} not found, skipping",
+            f"Reformatted: {a}",
+            f"Reformatted: {b}",
+        ]
+
+    @pytest.mark.parametrize(
+        ("flags", "expected"),
+        [
+            ([], "2 file(s) reformatted."),
+            (["--no-recursive"], "1 file(s) reformatted."),
+        ],
+        ids=["recursive-default", "no-recursive"],
+    )
+    def test_directory_recursion(self, flags, expected, tmp_path, capsys):
+        """Directories recurse by default; --no-recursive keeps to the top level."""
         (tmp_path / "top.py").write_bytes(WRAPPABLE_CONTENT)
         sub = tmp_path / "sub"
         sub.mkdir()
         (sub / "nested.py").write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--no-recursive", str(tmp_path)])
-        main()
+        main([*flags, str(tmp_path)])
         out = capsys.readouterr().out
-        assert "1 file(s) reformatted." in out
+        assert expected in out
 
-    def test_directory_recursive(self, tmp_path, monkeypatch, capsys):
-        """Directories recurse by default (no flag needed)."""
+    def test_directory_walk_skips_non_files(self, tmp_path, capsys):
+        """*.py directories, dangling *.py symlinks and symlinked dirs are skipped."""
         (tmp_path / "top.py").write_bytes(WRAPPABLE_CONTENT)
-        sub = tmp_path / "sub"
-        sub.mkdir()
-        (sub / "nested.py").write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(tmp_path)])
-        main()
-        out = capsys.readouterr().out
-        assert "2 file(s) reformatted." in out
+        (tmp_path / "pkg.py").mkdir()
+        (tmp_path / "pkg.py" / "inner.py").write_bytes(WRAPPABLE_CONTENT)
+        (tmp_path / "loop").symlink_to(tmp_path, target_is_directory=True)
+        (tmp_path / "bad.py").symlink_to(tmp_path / "missing")
+        main([str(tmp_path)])  # no SystemExit: exit code 0
+        captured = capsys.readouterr()
+        assert "2 file(s) reformatted." in captured.out
+        assert captured.err == ""
+
+    def test_unreadable_directory_skipped(self, tmp_path, monkeypatch, capsys):
+        """A directory that can't be listed is skipped rather than aborting the run."""
+        (tmp_path / "top.py").write_bytes(WRAPPABLE_CONTENT)
+        real_scandir = mod.os.scandir
+
+        def flaky_scandir(path):
+            if Path(path) == tmp_path / "locked":
+                raise PermissionError("denied")
+            return real_scandir(path)
+
+        (tmp_path / "locked").mkdir()
+        monkeypatch.setattr(mod.os, "scandir", flaky_scandir)
+        main([str(tmp_path)])
+        assert "1 file(s) reformatted." in capsys.readouterr().out
 
     def test_quit_stops_remaining_files(self, tmp_path, monkeypatch, capsys):
         """Pressing quit during interactive mode skips all remaining files."""
@@ -116,8 +169,7 @@ class TestMain:
         b = tmp_path / "b.py"
         b.write_bytes(WRAPPABLE_CONTENT)
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "q")
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(a), str(b)])
-        main()
+        main(["-i", str(a), str(b)])
         out = capsys.readouterr().out
         # First file is processed (user quits within it), second is skipped entirely
         assert "0 file(s) reformatted." in out
@@ -139,14 +191,84 @@ class TestMain:
             return real_process_file(filepath, *args, **kwargs)
 
         monkeypatch.setattr(mod, "process_file", failing_process_file)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(good), str(bad)])
         with pytest.raises(SystemExit) as exc_info:
-            main()
+            main([str(good), str(bad)])
         assert exc_info.value.code == 2
         err = capsys.readouterr().err
         assert "error: Failed to process" in err
         assert "fake read error" in err
 
+    def test_parallel_run_reports_in_input_order(self, tmp_path, monkeypatch, capsys):
+        """Files handed to the process pool are reported in order, errors included."""
+        monkeypatch.setattr(mod, "_PARALLEL_MIN_FILES", 2)
+        # Send errors to the same stream so their position among the results shows
+        monkeypatch.setattr("sys.stderr", sys.stdout)
+        # Enough files to fill the in-flight window (4 per worker) and drain past it
+        files = [tmp_path / f"{name}.py" for name in "jcaihbgdfe"]
+        for f in files:
+            f.write_bytes(WRAPPABLE_CONTENT)
+        bad = tmp_path / "bad.py"
+        bad.write_bytes(b"# \xff not utf-8\n")
+        ordered = [*files[:5], bad, *files[5:]]
+        with pytest.raises(SystemExit) as exc_info:
+            main(["-j", "2", *(str(f) for f in ordered)])
+        assert exc_info.value.code == 2
+        expected = [
+            f"error: Failed to process {f}:" if f == bad else f"Reformatted: {f}"
+            for f in ordered
+        ]
+        reported = [
+            line
+            for line in capsys.readouterr().out.splitlines()
+            if line.startswith(("Reformatted:", "error:"))
+        ]
+        assert len(reported) == len(expected)
+        assert all(line.startswith(e) for line, e in zip(reported, expected))
+        assert all(f.read_bytes() != WRAPPABLE_CONTENT for f in files)
+
+    def test_parallel_diff_shows_changed_files(self, tmp_path, monkeypatch, capsys):
+        """--diff through the process pool prints a diff for each changed file."""
+        monkeypatch.setattr(mod, "_PARALLEL_MIN_FILES", 2)
+        changed = [tmp_path / "a.py", tmp_path / "b.py"]
+        for f in changed:
+            f.write_bytes(WRAPPABLE_CONTENT)
+        clean = tmp_path / "c.py"
+        clean.write_bytes(b"x = 1\n")
+        argv = ["--diff", "-j", "2", *(str(f) for f in [*changed, clean])]
+        main(argv)
+        out = capsys.readouterr().out
+        for f in changed:
+            assert f"--- {f}" in out
+            assert f.read_bytes() == WRAPPABLE_CONTENT
+        assert f"--- {clean}" not in out
+
+    @pytest.mark.parametrize(
+        ("jobs", "min_files"), [("1", 2), ("2", 8)], ids=["one-job", "few-files"]
+    )
+    def test_serial_without_pool(self, tmp_path, monkeypatch, jobs, min_files):
+        """-j 1, or fewer files than the parallel threshold, runs in-process."""
+        monkeypatch.setattr(mod, "_PARALLEL_MIN_FILES", min_files)
+
+        def no_pool(*args):
+            raise AssertionError("process pool should not be used")
+
+        monkeypatch.setattr(mod, "_submit_to_pool", no_pool)
+        files = [tmp_path / f"{name}.py" for name in ("a", "b", "c")]
+        for f in files:
+            f.write_bytes(WRAPPABLE_CONTENT)
+        main(["-j", jobs, str(tmp_path)])
+        assert all(f.read_bytes() != WRAPPABLE_CONTENT for f in files)
+
+    def test_jobs_below_one_exits_1(self, tmp_path, capsys):
+        """--jobs 0 prints an error and exits 1."""
+        f = tmp_path / "a.py"
+        f.write_bytes(WRAPPABLE_CONTENT)
+        with pytest.raises(SystemExit) as exc_info:
+            main(["--jobs", "0", str(f)])
+        assert exc_info.value.code == 1
+        assert "--jobs must be at least 1" in capsys.readouterr().err
+        assert f.read_bytes() == WRAPPABLE_CONTENT
+
 
 class TestEntryPoints:
     """Tests that exercise __main__.py and cli.py entry points."""
@@ -160,50 +282,56 @@ class TestEntryPoints:
         out = capsys.readouterr().out
         assert "0 file(s) reformatted." in out
 
-    def test_console_script(self, tmp_path):
-        """The installed 'octowrap' console script works end to end."""
+    def test_console_script(self, tmp_path, monkeypatch, capsys):
+        """The installed 'octowrap' console script entry point resolves to main."""
+        (ep,) = importlib.metadata.entry_points(group="console_scripts").select(
+            name="octowrap"
+        )
+        entry = ep.load()
+        assert entry is main
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        result = subprocess.run(
-            ["octowrap", str(f)],
-            capture_output=True,
-            text=True,
-        )
-        assert result.returncode == 0
-        assert "1 file(s) reformatted." in result.stdout
+        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
+        entry()
+        assert "1 file(s) reformatted." in capsys.readouterr().out
 
 
 class TestConfigIntegration:
     """End-to-end tests for pyproject.toml config support."""
 
-    def test_config_sets_line_length(self, tmp_path, monkeypatch, capsys):
-        """Config line-length is respected when CLI flag is absent."""
-        (tmp_path / "pyproject.toml").write_text("[tool.octowrap]\nline-length = 40\n")
+    pytestmark = pytest.mark.config
+
+    @pytest.mark.parametrize(
+        ("config_dir", "extra_args", "width"),
+        [
+            (".", [], 40),
+            (".", ["-l", "88"], 88),
+            ("custom", ["--config", "custom/pyproject.toml"], 40),
+            (".", ["--config", "pyproject.toml", "-l", "88"], 88),
+        ],
+        ids=[
+            "discovered-config",
+            "cli-overrides-discovered-config",
+            "config-flag",
+            "cli-overrides-config-flag",
+        ],
+    )
+    def test_line_length_precedence(
+        self, tmp_path, monkeypatch, config_dir, extra_args, width
+    ):
+        """CLI --line-length wins over config, whether discovered or via --config."""
+        cfg_dir = tmp_path / config_dir
+        cfg_dir.mkdir(exist_ok=True)
+        (cfg_dir / "pyproject.toml").write_text("[tool.octowrap]\nline-length = 40\n")
+        comment = "# A moderately long comment that fits at 88 but not at 40."
         f = tmp_path / "a.py"
-        f.write_bytes(
-            b"# A moderately long comment that fits at 88 but not at 40.\nx = 1\n"
-        )
+        f.write_text(f"{comment}\nx = 1\n")
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
-        content = f.read_text()
-        assert all(len(line) <= 40 for line in content.splitlines())
-
-    def test_cli_overrides_config_line_length(self, tmp_path, monkeypatch, capsys):
-        """CLI --line-length takes precedence over config."""
-        (tmp_path / "pyproject.toml").write_text("[tool.octowrap]\nline-length = 40\n")
-        f = tmp_path / "a.py"
-        f.write_bytes(
-            b"# A moderately long comment that fits at 88 but not at 40.\nx = 1\n"
-        )
-        monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-l", "88", str(f)])
-        main()
-        content = f.read_text()
-        # At width 88 the comment fits on one line
-        assert content.startswith(
-            "# A moderately long comment that fits at 88 but not at 40.\n"
-        )
+        main([*extra_args, str(f)])
+        lines = f.read_text().splitlines()
+        assert all(len(line) <= width for line in lines)
+        # At width 88 the comment fits on one line and is left alone.
+        assert (lines[0] == comment) == (width == 88)
 
     def test_config_sets_recursive_false(self, tmp_path, monkeypatch, capsys):
         """Config recursive = false disables the default recursion."""
@@ -213,8 +341,7 @@ class TestConfigIntegration:
         sub.mkdir()
         (sub / "nested.py").write_bytes(WRAPPABLE_CONTENT)
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(tmp_path)])
-        main()
+        main([str(tmp_path)])
         out = capsys.readouterr().out
         assert "1 file(s) reformatted." in out
 
@@ -224,9 +351,8 @@ class TestConfigIntegration:
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
         with pytest.raises(SystemExit, match="1"):
-            main()
+            main([str(f)])
         err = capsys.readouterr().err
         assert "config error" in err
 
@@ -235,8 +361,7 @@ class TestConfigIntegration:
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         out = capsys.readouterr().out
         assert "1 file(s) reformatted." in out
 
@@ -254,12 +379,25 @@ class TestConfigIntegration:
         custom_dir.mkdir()
         (custom_dir / "b.py").write_bytes(WRAPPABLE_CONTENT)
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(tmp_path)])
-        main()
+        main([str(tmp_path)])
         out = capsys.readouterr().out
         # Only .venv/a.py should be processed (custom_dir excluded)
         assert "1 file(s) reformatted." in out
 
+    def test_config_empty_exclude_processes_everything(
+        self, tmp_path, monkeypatch, capsys
+    ):
+        """An empty exclude list turns off directory exclusion entirely."""
+        (tmp_path / "pyproject.toml").write_text("[tool.octowrap]\nexclude = []\n")
+        venv_dir = tmp_path / ".venv"
+        venv_dir.mkdir()
+        (venv_dir / "a.py").write_bytes(WRAPPABLE_CONTENT)
+        (tmp_path / "b.py").write_bytes(WRAPPABLE_CONTENT)
+        monkeypatch.chdir(tmp_path)
+        main([str(tmp_path)])
+        out = capsys.readouterr().out
+        assert "2 file(s) reformatted." in out
+
     def test_config_extend_exclude(self, tmp_path, monkeypatch, capsys):
         """Config extend-exclude adds to the default exclude list."""
         (tmp_path / "pyproject.toml").write_text(
@@ -276,14 +414,11 @@ class TestConfigIntegration:
         # top level file should be processed
         (tmp_path / "c.py").write_bytes(WRAPPABLE_CONTENT)
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(tmp_path)])
-        main()
+        main([str(tmp_path)])
         out = capsys.readouterr().out
         assert "1 file(s) reformatted." in out
 
-    def test_config_todo_patterns_replaces_defaults(
-        self, tmp_path, monkeypatch, capsys
-    ):
+    def test_config_todo_patterns_replaces_defaults(self, tmp_path, monkeypatch):
         """Config todo-patterns replaces the default TODO/FIXME patterns."""
         (tmp_path / "pyproject.toml").write_text(
             '[tool.octowrap]\ntodo-patterns = ["note"]\n'
@@ -294,16 +429,14 @@ class TestConfigIntegration:
             b"# NOTE: This is a long note that exceeds the line length and should be rewrapped as a todo-style marker item\nx = 1\n"
         )
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         content = f.read_text()
         lines = content.splitlines()
         assert lines[0].startswith("# NOTE: ")
         # TODO should NOT be treated as a marker since defaults are replaced
         f2 = tmp_path / "b.py"
         f2.write_bytes(b"# TODO: short\nx = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f2)])
-        main()
+        main([str(f2)])
         assert "# TODO: short" in f2.read_text()
 
     def test_config_empty_todo_patterns_ignores_extend(self, tmp_path, monkeypatch):
@@ -316,8 +449,7 @@ class TestConfigIntegration:
             b"# TODO: This is a long todo that exceeds the line length and should be rewrapped as a normal prose comment now\nx = 1\n"
         )
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         content = f.read_text()
         lines = content.splitlines()
         # TODO should NOT be treated as a marker — continuation lines should use
@@ -335,15 +467,14 @@ class TestConfigIntegration:
             b"# HACK: This is a long hack comment that exceeds the line length and should be rewrapped as a todo-style marker item\nx = 1\n"
         )
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         content = f.read_text()
         lines = content.splitlines()
         # HACK should be treated as a marker via extend-todo-patterns
         assert lines[0].startswith("# HACK: ")
         assert lines[1].startswith("#  ")
 
-    def test_config_extend_todo_patterns(self, tmp_path, monkeypatch, capsys):
+    def test_config_extend_todo_patterns(self, tmp_path, monkeypatch):
         """Config extend-todo-patterns adds to the default patterns."""
         (tmp_path / "pyproject.toml").write_text(
             '[tool.octowrap]\nextend-todo-patterns = ["note"]\n'
@@ -353,8 +484,7 @@ class TestConfigIntegration:
             b"# NOTE: This is a long note that exceeds the line length and should be rewrapped as a todo-style marker item\nx = 1\n"
         )
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         content = f.read_text()
         lines = content.splitlines()
         assert lines[0].startswith("# NOTE: ")
@@ -363,38 +493,9 @@ class TestConfigIntegration:
 class TestConfigFlag:
     """Tests for the --config flag."""
 
-    def test_config_flag_reads_specified_file(self, tmp_path, monkeypatch, capsys):
-        """--config points to a specific pyproject.toml."""
-        cfg = tmp_path / "custom" / "pyproject.toml"
-        cfg.parent.mkdir()
-        cfg.write_text("[tool.octowrap]\nline-length = 40\n")
-        f = tmp_path / "a.py"
-        f.write_bytes(
-            b"# A moderately long comment that fits at 88 but not at 40.\nx = 1\n"
-        )
-        monkeypatch.setattr("sys.argv", ["octowrap", "--config", str(cfg), str(f)])
-        main()
-        content = f.read_text()
-        assert all(len(line) <= 40 for line in content.splitlines())
+    pytestmark = pytest.mark.config
 
-    def test_config_flag_overridden_by_cli(self, tmp_path, monkeypatch, capsys):
-        """CLI --line-length takes precedence over --config values."""
-        cfg = tmp_path / "pyproject.toml"
-        cfg.write_text("[tool.octowrap]\nline-length = 40\n")
-        f = tmp_path / "a.py"
-        f.write_bytes(
-            b"# A moderately long comment that fits at 88 but not at 40.\nx = 1\n"
-        )
-        monkeypatch.setattr(
-            "sys.argv", ["octowrap", "--config", str(cfg), "-l", "88", str(f)]
-        )
-        main()
-        content = f.read_text()
-        assert content.startswith(
-            "# A moderately long comment that fits at 88 but not at 40.\n"
-        )
-
-    def test_config_flag_ignores_auto_discovery(self, tmp_path, monkeypatch, capsys):
+    def test_config_flag_ignores_auto_discovery(self, tmp_path, monkeypatch):
         """--config prevents auto-discovery of a nearer pyproject.toml."""
         # Place a config in CWD that sets line-length = 40
         (tmp_path / "pyproject.toml").write_text("[tool.octowrap]\nline-length = 40\n")
@@ -407,23 +508,21 @@ class TestConfigFlag:
             b"# A moderately long comment that fits at 88 but not at 40.\nx = 1\n"
         )
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--config", str(alt), str(f)])
-        main()
+        main(["--config", str(alt), str(f)])
         content = f.read_text()
         # Should use default 88, not the CWD config's 40
         assert content.startswith(
             "# A moderately long comment that fits at 88 but not at 40.\n"
         )
 
-    def test_config_flag_invalid_file_exits(self, tmp_path, monkeypatch, capsys):
+    def test_config_flag_invalid_file_exits(self, tmp_path, capsys):
         """--config pointing to a file with bad config causes exit."""
         cfg = tmp_path / "pyproject.toml"
         cfg.write_text("[tool.octowrap]\nbogus = 42\n")
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", "--config", str(cfg), str(f)])
         with pytest.raises(SystemExit, match="1"):
-            main()
+            main(["--config", str(cfg), str(f)])
         err = capsys.readouterr().err
         assert "config error" in err
 
@@ -431,77 +530,111 @@ class TestConfigFlag:
 class TestCheckMode:
     """Tests for the --check flag."""
 
-    def test_check_exits_zero_when_clean(self, tmp_path, monkeypatch, capsys):
+    def test_check_exits_zero_when_clean(self, tmp_path, capsys):
         """No changes needed -> exit 0."""
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", "--check", str(f)])
-        main()  # should not raise
+        main(["--check", str(f)])  # should not raise
         out = capsys.readouterr().out
         assert "0 file(s) would be reformatted." in out
 
-    def test_check_exits_one_when_dirty(self, tmp_path, monkeypatch, capsys):
+    def test_check_exits_one_when_dirty(self, tmp_path):
         """Changes needed -> exit 1."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--check", str(f)])
         with pytest.raises(SystemExit, match="1"):
-            main()
+            main(["--check", str(f)])
 
-    def test_check_with_diff(self, tmp_path, monkeypatch, capsys):
+    def test_check_with_diff(self, tmp_path, capsys):
         """--check --diff shows diff AND exits 1."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--check", "--diff", str(f)])
         with pytest.raises(SystemExit, match="1"):
-            main()
+            main(["--check", "--diff", str(f)])
         out = capsys.readouterr().out
         assert "---" in out
         assert "+++" in out
 
-    def test_check_does_not_write(self, tmp_path, monkeypatch, capsys):
+    def test_check_does_not_write(self, tmp_path):
         """--check must not modify files on disk."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--check", str(f)])
         with pytest.raises(SystemExit):
-            main()
+            main(["--check", str(f)])
         assert f.read_bytes() == WRAPPABLE_CONTENT
 
 
+class TestIsExcluded:
+    """Tests for is_excluded()."""
+
+    def test_matches_any_component(self):
+        assert mod.is_excluded(Path("src/.venv/lib/a.py"), [".venv"])
+
+    def test_glob_patterns(self):
+        assert mod.is_excluded(Path("pkg/gen_models.py"), ["gen_*.py"])
+        assert mod.is_excluded(Path("pkg/build1/a.py"), ["build[0-9]"])
+        assert not mod.is_excluded(Path("pkg/models.py"), ["gen_*.py"])
+
+    def test_whole_component_only(self):
+        """A pattern must match a full component, not a substring of one."""
+        assert not mod.is_excluded(Path("rebuild/a.py"), ["build"])
+
+    def test_empty_patterns(self):
+        assert not mod.is_excluded(Path(".venv/a.py"), [])
+
+
 class TestDefaultExcludes:
     """Tests for default directory exclusion."""
 
-    def test_default_excludes_skip_venv(self, tmp_path, monkeypatch, capsys):
+    def test_default_excludes_skip_venv(self, tmp_path, capsys):
         """.venv/ is auto skipped by default excludes."""
         venv_dir = tmp_path / ".venv"
         venv_dir.mkdir()
         (venv_dir / "a.py").write_bytes(WRAPPABLE_CONTENT)
         (tmp_path / "b.py").write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(tmp_path)])
-        main()
+        main([str(tmp_path)])
         out = capsys.readouterr().out
         assert "1 file(s) reformatted." in out
 
-    def test_default_excludes_skip_pycache(self, tmp_path, monkeypatch, capsys):
+    def test_default_excludes_skip_pycache(self, tmp_path, capsys):
         """__pycache__/ is auto skipped by default excludes."""
         cache_dir = tmp_path / "__pycache__"
         cache_dir.mkdir()
         (cache_dir / "a.py").write_bytes(WRAPPABLE_CONTENT)
         (tmp_path / "b.py").write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(tmp_path)])
-        main()
+        main([str(tmp_path)])
         out = capsys.readouterr().out
         assert "1 file(s) reformatted." in out
 
-    def test_excludes_do_not_affect_explicit_files(self, tmp_path, monkeypatch, capsys):
+    def test_excluded_directory_given_directly_is_skipped(self, tmp_path):
+        """A directory argument that is itself excluded yields no files."""
+        build_dir = tmp_path / "build"
+        build_dir.mkdir()
+        (build_dir / "a.py").write_bytes(WRAPPABLE_CONTENT)
+        main([str(build_dir)])
+        assert (build_dir / "a.py").read_bytes() == WRAPPABLE_CONTENT
+
+    @pytest.mark.config
+    def test_exclude_pattern_matches_file_names(self, tmp_path, monkeypatch, capsys):
+        """Exclude globs apply to file names as well as directories."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.octowrap]\nextend-exclude = ["gen_*.py"]\n'
+        )
+        (tmp_path / "gen_models.py").write_bytes(WRAPPABLE_CONTENT)
+        (tmp_path / "b.py").write_bytes(WRAPPABLE_CONTENT)
+        monkeypatch.chdir(tmp_path)
+        main([str(tmp_path)])
+        out = capsys.readouterr().out
+        assert "1 file(s) reformatted." in out
+        assert (tmp_path / "gen_models.py").read_bytes() == WRAPPABLE_CONTENT
+
+    def test_excludes_do_not_affect_explicit_files(self, tmp_path, capsys):
         """Passing a file directly always processes it, even in excluded dir."""
         venv_dir = tmp_path / ".venv"
         venv_dir.mkdir()
         f = venv_dir / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         out = capsys.readouterr().out
         assert "1 file(s) reformatted." in out
 
@@ -509,80 +642,74 @@ class TestDefaultExcludes:
 class TestColorFlags:
     """Tests for --color/--no-color/auto-detect."""
 
-    def test_force_color_on(self, tmp_path, monkeypatch, capsys):
+    def test_force_color_on(self, tmp_path, monkeypatch):
         """--color forces _USE_COLOR to True regardless of TTY."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--color", "-i", str(f)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "s")
-        main()
+        main(["--color", "-i", str(f)])
         assert mod._USE_COLOR is True
 
-    def test_force_color_off(self, tmp_path, monkeypatch, capsys):
+    def test_force_color_off(self, tmp_path):
         """--no-color forces _USE_COLOR to False regardless of TTY."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--no-color", str(f)])
-        main()
+        main(["--no-color", str(f)])
         assert mod._USE_COLOR is False
 
-    def test_auto_detect_tty(self, tmp_path, monkeypatch, capsys):
+    def test_auto_detect_tty(self, tmp_path, monkeypatch):
         """Without flags, color is enabled when stdout is a TTY."""
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
         monkeypatch.setattr("sys.stdout.isatty", lambda: True)
         monkeypatch.delenv("NO_COLOR", raising=False)
-        main()
+        main([str(f)])
         assert mod._USE_COLOR is True
 
-    def test_auto_detect_non_tty(self, tmp_path, monkeypatch, capsys):
+    def test_auto_detect_non_tty(self, tmp_path, monkeypatch):
         """Without flags, color is disabled when stdout is not a TTY."""
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
         monkeypatch.setattr("sys.stdout.isatty", lambda: False)
-        main()
+        main([str(f)])
         assert mod._USE_COLOR is False
 
-    def test_no_color_env_var(self, tmp_path, monkeypatch, capsys):
+    def test_no_color_env_var(self, tmp_path, monkeypatch):
         """NO_COLOR env var disables color even on a TTY."""
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
         monkeypatch.setattr("sys.stdout.isatty", lambda: True)
         monkeypatch.setenv("NO_COLOR", "1")
-        main()
+        main([str(f)])
         assert mod._USE_COLOR is False
 
-    def test_color_flag_overrides_no_color_env(self, tmp_path, monkeypatch, capsys):
+    def test_color_flag_overrides_no_color_env(self, tmp_path, monkeypatch):
         """Explicit --color wins over NO_COLOR env var."""
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", "--color", str(f)])
         monkeypatch.setenv("NO_COLOR", "1")
-        main()
+        main(["--color", str(f)])
         assert mod._USE_COLOR is True
 
-    def test_color_and_no_color_mutually_exclusive(self, tmp_path, monkeypatch):
+    def test_color_and_no_color_mutually_exclusive(self, tmp_path):
         """--color and --no-color cannot be used together."""
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr("sys.argv", ["octowrap", "--color", "--no-color", str(f)])
         with pytest.raises(SystemExit, match="2"):
-            main()
+            main(["--color", "--no-color", str(f)])
 
 
 class TestStdinMode:
     """Tests for reading from stdin when '-' is passed."""
 
-    def test_stdin_basic(self, monkeypatch, capsys):
+    pytestmark = pytest.mark.stdin
+
+    def test_stdin_basic(self, stdin_buf, capsys):
         """Output contains rewrapped comment, no status messages."""
         src = "# This is a comment that was wrapped\n# at a short width previously.\nx = 1\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr("sys.argv", ["octowrap", "-"])
+        stdin_buf(src)
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(["-"])
         out = capsys.readouterr().out
         assert (
             "# This is a comment that was wrapped at a short width previously." in out
@@ -590,96 +717,76 @@ class TestStdinMode:
         assert "Reformatted" not in out
         assert "file(s)" not in out
 
-    def test_stdin_no_changes(self, monkeypatch, capsys):
+    def test_stdin_no_changes(self, stdin_buf, capsys):
         """When nothing changes, output equals input."""
         src = "x = 1\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr("sys.argv", ["octowrap", "-"])
+        stdin_buf(src)
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(["-"])
         out = capsys.readouterr().out
         assert out == src
 
-    def test_stdin_check_clean(self, monkeypatch, capsys):
-        """--check with clean input exits 0."""
-        monkeypatch.setattr("sys.stdin", io.StringIO("x = 1\n"))
-        monkeypatch.setattr("sys.argv", ["octowrap", "--check", "-"])
-        with pytest.raises(SystemExit, match="0"):
-            main()
-
-    def test_stdin_check_dirty(self, monkeypatch, capsys):
-        """--check with dirty input exits 1."""
-        src = "# This is a comment that was wrapped\n# at a short width previously.\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr("sys.argv", ["octowrap", "--check", "-"])
-        with pytest.raises(SystemExit, match="1"):
-            main()
-
-    def test_stdin_diff(self, monkeypatch, capsys):
-        """--diff output contains unified diff with <stdin>."""
-        src = "# This is a comment that was wrapped\n# at a short width previously.\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr("sys.argv", ["octowrap", "--diff", "-"])
-        with pytest.raises(SystemExit, match="0"):
-            main()
-        out = capsys.readouterr().out
-        assert "--- <stdin>" in out
-        assert "+++ <stdin>" in out
-
-    def test_stdin_diff_check_dirty(self, monkeypatch, capsys):
-        """--diff --check with dirty input shows diff and exits 1."""
-        src = "# This is a comment that was wrapped\n# at a short width previously.\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr("sys.argv", ["octowrap", "--diff", "--check", "-"])
-        with pytest.raises(SystemExit, match="1"):
-            main()
-        out = capsys.readouterr().out
-        assert "--- <stdin>" in out
-        assert "+++ <stdin>" in out
-
-    def test_stdin_diff_check_clean(self, monkeypatch, capsys):
-        """--diff --check with clean input exits 0 with no output."""
-        monkeypatch.setattr("sys.stdin", io.StringIO("x = 1\n"))
-        monkeypatch.setattr("sys.argv", ["octowrap", "--diff", "--check", "-"])
-        with pytest.raises(SystemExit, match="0"):
-            main()
+    @pytest.mark.parametrize(
+        ("flags", "src", "code", "shows_diff"),
+        [
+            (["--check"], "x = 1\n", "0", False),
+            (["--check"], STDIN_DIRTY, "1", False),
+            (["--diff"], "x = 1\n", "0", False),
+            (["--diff"], STDIN_DIRTY, "0", True),
+            (["--diff", "--check"], "x = 1\n", "0", False),
+            (["--diff", "--check"], STDIN_DIRTY, "1", True),
+        ],
+        ids=[
+            "check-clean",
+            "check-dirty",
+            "diff-clean",
+            "diff-dirty",
+            "diff-check-clean",
+            "diff-check-dirty",
+        ],
+    )
+    def test_stdin_check_diff(self, flags, src, code, shows_diff, stdin_buf, capsys):
+        """--check sets the exit code, --diff prints a <stdin> diff; neither echoes."""
+        stdin_buf(src)
+        with pytest.raises(SystemExit, match=code):
+            main([*flags, "-"])
         out = capsys.readouterr().out
-        assert out == ""
+        if shows_diff:
+            assert "--- <stdin>" in out
+            assert "+++ <stdin>" in out
+        else:
+            assert out == ""
 
-    def test_stdin_mixed_paths_error(self, monkeypatch, capsys):
+    def test_stdin_mixed_paths_error(self, stdin_buf, capsys):
         """Mixing '-' with other paths prints error and exits 1."""
-        monkeypatch.setattr("sys.stdin", io.StringIO(""))
-        monkeypatch.setattr("sys.argv", ["octowrap", "-", "foo.py"])
+        stdin_buf("")
         with pytest.raises(SystemExit, match="1"):
-            main()
+            main(["-", "foo.py"])
         err = capsys.readouterr().err
         assert "cannot be mixed" in err
 
-    def test_stdin_interactive_error(self, monkeypatch, capsys):
+    def test_stdin_interactive_error(self, stdin_buf, capsys):
         """--interactive with stdin prints error and exits 1."""
-        monkeypatch.setattr("sys.stdin", io.StringIO(""))
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", "-"])
+        stdin_buf("")
         with pytest.raises(SystemExit, match="1"):
-            main()
+            main(["-i", "-"])
         err = capsys.readouterr().err
         assert "cannot be used with stdin" in err
 
-    def test_stdin_empty(self, monkeypatch, capsys):
+    def test_stdin_empty(self, stdin_buf, capsys):
         """Empty stdin produces empty output and exits 0."""
-        monkeypatch.setattr("sys.stdin", io.StringIO(""))
-        monkeypatch.setattr("sys.argv", ["octowrap", "-"])
+        stdin_buf("")
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(["-"])
         out = capsys.readouterr().out
         assert out == ""
 
-    def test_stdin_line_length(self, monkeypatch, capsys):
+    def test_stdin_line_length(self, stdin_buf, capsys):
         """Respects -l flag for stdin input."""
         src = "# A moderately long comment that fits at 88 but not at 40.\nx = 1\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr("sys.argv", ["octowrap", "-l", "40", "-"])
+        stdin_buf(src)
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(["-l", "40", "-"])
         out = capsys.readouterr().out
         assert all(len(line) <= 40 for line in out.splitlines())
 
@@ -687,33 +794,32 @@ class TestStdinMode:
 class TestStdinFilename:
     """Tests for the --stdin-filename flag."""
 
-    def test_stdin_filename_in_diff(self, monkeypatch, capsys):
+    pytestmark = pytest.mark.stdin
+
+    def test_stdin_filename_in_diff(self, stdin_buf, capsys):
         """--stdin-filename shows the given name in diff headers instead of <stdin>."""
         src = "# This is a comment that was wrapped\n# at a short width previously.\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr(
-            "sys.argv", ["octowrap", "--diff", "--stdin-filename", "src/app.py", "-"]
-        )
+        stdin_buf(src)
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(["--diff", "--stdin-filename", "src/app.py", "-"])
         out = capsys.readouterr().out
         expected = str(Path("src/app.py"))
         assert f"--- {expected}" in out
         assert f"+++ {expected}" in out
 
-    def test_stdin_filename_without_stdin_errors(self, tmp_path, monkeypatch, capsys):
+    def test_stdin_filename_without_stdin_errors(self, tmp_path, capsys):
         """--stdin-filename without '-' prints an error and exits 1."""
         f = tmp_path / "a.py"
         f.write_bytes(b"x = 1\n")
-        monkeypatch.setattr(
-            "sys.argv", ["octowrap", "--stdin-filename", "foo.py", str(f)]
-        )
         with pytest.raises(SystemExit, match="1"):
-            main()
+            main(["--stdin-filename", "foo.py", str(f)])
         err = capsys.readouterr().err
         assert "--stdin-filename requires" in err
 
-    def test_stdin_filename_config_discovery(self, tmp_path, monkeypatch, capsys):
+    @pytest.mark.config
+    def test_stdin_filename_config_discovery(
+        self, stdin_buf, tmp_path, monkeypatch, capsys
+    ):
         """Config is discovered from --stdin-filename's parent, not CWD."""
         # Create a pyproject.toml in a subdirectory with a short line-length
         sub = tmp_path / "project"
@@ -724,17 +830,16 @@ class TestStdinFilename:
         # CWD has no config
         monkeypatch.chdir(tmp_path)
         src = "# A moderately long comment that fits at 88 but not at 40.\nx = 1\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr(
-            "sys.argv",
-            ["octowrap", "--stdin-filename", str(sub / "mod.py"), "-"],
-        )
+        stdin_buf(src)
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(["--stdin-filename", str(sub / "mod.py"), "-"])
         out = capsys.readouterr().out
         assert all(len(line) <= 40 for line in out.splitlines())
 
-    def test_stdin_filename_with_explicit_config(self, tmp_path, monkeypatch, capsys):
+    @pytest.mark.config
+    def test_stdin_filename_with_explicit_config(
+        self, stdin_buf, tmp_path, monkeypatch, capsys
+    ):
         """--config takes precedence over --stdin-filename for config discovery."""
         # stdin-filename's parent has one config
         sub = tmp_path / "project"
@@ -748,20 +853,17 @@ class TestStdinFilename:
 
         monkeypatch.chdir(tmp_path)
         src = "# A moderately long comment that fits at 88 and at 60 but not at 40.\nx = 1\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr(
-            "sys.argv",
-            [
-                "octowrap",
-                "--config",
-                str(explicit),
-                "--stdin-filename",
-                str(sub / "mod.py"),
-                "-",
-            ],
-        )
+        stdin_buf(src)
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(
+                [
+                    "--config",
+                    str(explicit),
+                    "--stdin-filename",
+                    str(sub / "mod.py"),
+                    "-",
+                ]
+            )
         out = capsys.readouterr().out
         # With line-length=60, the comment should be wrapped (not at 40)
         assert all(len(line) <= 60 for line in out.splitlines())
@@ -769,15 +871,12 @@ class TestStdinFilename:
         comment_lines = [ln for ln in out.splitlines() if ln.startswith("#")]
         assert len(comment_lines) > 1
 
-    def test_stdin_filename_basic_output(self, monkeypatch, capsys):
+    def test_stdin_filename_basic_output(self, stdin_buf, capsys):
         """Normal output is unaffected by --stdin-filename."""
         src = "# This is a comment that was wrapped\n# at a short width previously.\nx = 1\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr(
-            "sys.argv", ["octowrap", "--stdin-filename", "src/app.py", "-"]
-        )
+        stdin_buf(src)
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(["--stdin-filename", "src/app.py", "-"])
         out = capsys.readouterr().out
         assert (
             "# This is a comment that was wrapped at a short width previously." in out
@@ -792,9 +891,8 @@ class TestInteractiveProgress:
         """Progress counter [1/N] appears in interactive diff output."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(f)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(f)])
         out = capsys.readouterr().out
         assert "[1/1]" in out
 
@@ -804,19 +902,17 @@ class TestInteractiveProgress:
         a.write_bytes(WRAPPABLE_CONTENT)
         b = tmp_path / "b.py"
         b.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(a), str(b)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(a), str(b)])
         out = capsys.readouterr().out
         assert "[1/2]" in out
         assert "[2/2]" in out
 
-    def test_no_progress_in_non_interactive_mode(self, tmp_path, monkeypatch, capsys):
+    def test_no_progress_in_non_interactive_mode(self, tmp_path, capsys):
         """No [X/Y] progress indicator appears outside interactive mode."""
         f = tmp_path / "a.py"
         f.write_bytes(WRAPPABLE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         out = capsys.readouterr().out
         assert "[1/" not in out
 
@@ -832,9 +928,8 @@ class TestInteractiveProgress:
         )
         f = tmp_path / "a.py"
         f.write_bytes(content)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(f)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(f)])
         out = capsys.readouterr().out
         assert "[1/2]" in out
         assert "[2/2]" in out
@@ -850,9 +945,8 @@ class TestInteractiveProgress:
         )
         f = tmp_path / "a.py"
         f.write_bytes(content)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(f)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(f)])
         out = capsys.readouterr().out
         # Only one block changes, so total should be 1
         assert "[1/1]" in out
@@ -868,9 +962,8 @@ class TestInteractiveProgress:
         )
         f = tmp_path / "a.py"
         f.write_bytes(content)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(f)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(f)])
         out = capsys.readouterr().out
         # The block is disabled so nothing should be prompted
         assert "[1/" not in out
@@ -891,9 +984,8 @@ class TestInteractiveProgress:
         )
         f = tmp_path / "a.py"
         f.write_bytes(content)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(f)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(f)])
         out = capsys.readouterr().out
         assert "[1/1]" in out
 
@@ -916,9 +1008,8 @@ class TestInteractiveProgress:
             return real_count(content, *a, **kw)
 
         monkeypatch.setattr(mod, "count_changed_blocks", failing_count)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(bad), str(good)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(bad), str(good)])
         out = capsys.readouterr().out
         # Only good.py was counted in pre-scan, so total is 1
         assert "[1/1]" in out
@@ -934,42 +1025,40 @@ class TestNoInlineFlag:
     )
     # fmt: on
 
-    def test_no_inline_flag_disables_extraction(self, tmp_path, monkeypatch, capsys):
+    def test_no_inline_flag_disables_extraction(self, tmp_path, capsys):
         """With --no-inline, overflowing inline comments are not extracted."""
         f = tmp_path / "a.py"
         f.write_bytes(self.INLINE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--no-inline", str(f)])
-        main()
+        main(["--no-inline", str(f)])
         out = capsys.readouterr().out
         assert "0 file(s) reformatted." in out
 
-    def test_default_extracts_inline(self, tmp_path, monkeypatch, capsys):
+    def test_default_extracts_inline(self, tmp_path, capsys):
         """By default, overflowing inline comments are extracted."""
         f = tmp_path / "a.py"
         f.write_bytes(self.INLINE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         out = capsys.readouterr().out
         assert "1 file(s) reformatted." in out
 
+    @pytest.mark.config
     def test_config_inline_false(self, tmp_path, monkeypatch, capsys):
         """Config inline = false disables extraction."""
         (tmp_path / "pyproject.toml").write_text("[tool.octowrap]\ninline = false\n")
         f = tmp_path / "a.py"
         f.write_bytes(self.INLINE_CONTENT)
         monkeypatch.chdir(tmp_path)
-        monkeypatch.setattr("sys.argv", ["octowrap", str(f)])
-        main()
+        main([str(f)])
         out = capsys.readouterr().out
         assert "0 file(s) reformatted." in out
 
-    def test_no_inline_stdin(self, monkeypatch, capsys):
+    @pytest.mark.stdin
+    def test_no_inline_stdin(self, stdin_buf, capsys):
         """--no-inline works in stdin mode too."""
         src = "x = some_really_long_function_call(arg1, arg2)  # This comment pushes the line way past the limit\n"
-        monkeypatch.setattr("sys.stdin", io.StringIO(src))
-        monkeypatch.setattr("sys.argv", ["octowrap", "--no-inline", "-"])
+        stdin_buf(src)
         with pytest.raises(SystemExit, match="0"):
-            main()
+            main(["--no-inline", "-"])
         out = capsys.readouterr().out
         assert out == src
 
@@ -977,9 +1066,8 @@ class TestNoInlineFlag:
         """Interactive progress indicator counts inline extractions."""
         f = tmp_path / "a.py"
         f.write_bytes(self.INLINE_CONTENT)
-        monkeypatch.setattr("sys.argv", ["octowrap", "-i", str(f)])
         monkeypatch.setattr("octowrap.rewrap.prompt_user", lambda: "a")
-        main()
+        main(["-i", str(f)])
         out = capsys.readouterr().out
         assert "[1/1]" in out
 
@@ -987,7 +1075,7 @@ class TestNoInlineFlag:
 class TestDiffUtf8:
     """Tests for UTF-8 handling in diff mode."""
 
-    def test_diff_reads_utf8(self, tmp_path, monkeypatch, capsys):
+    def test_diff_reads_utf8(self, tmp_path, capsys):
         """--diff correctly reads and diffs files with non-ASCII comments."""
         raw = (
             b"# Erd\xc5\x91s\xe2\x80\x93Kac theorem says \xcf\x80(x) is\n"
@@ -996,7 +1084,19 @@ class TestDiffUtf8:
         )
         f = tmp_path / "utf8.py"
         f.write_bytes(raw)
-        monkeypatch.setattr("sys.argv", ["octowrap", "--diff", str(f)])
-        main()
+        main(["--diff", str(f)])
         out = capsys.readouterr().out
         assert "Erd\u0151s" in out
+
+
+class TestDiffLineEndings:
+    """Tests for --diff against files that don't use LF endings."""
+
+    def test_diff_crlf_only_shows_changed_lines(self, tmp_path, capsys):
+        """Unchanged CRLF lines appear as context, not as removed and re-added."""
+        f = tmp_path / "win.py"
+        f.write_bytes(b"x = 1\r\n" + WRAPPABLE_CONTENT.replace(b"\n", b"\r\n"))
+        main(["--diff", str(f)])
+        out = capsys.readouterr().out
+        assert " x = 1\r\n" in out
+        assert "-x = 1" not in out
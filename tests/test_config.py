@@ -64,12 +64,30 @@ class TestLoadConfig:
         result = load_config(tmp_path / "pyproject.toml")
         assert result == {}
 
+    def test_file_without_tool_table_returns_empty(self, tmp_path):
+        _write_pyproject(tmp_path, b'[project]\nname = "x"\n')
+        assert load_config(tmp_path / "pyproject.toml") == {}
+
     def test_no_file_returns_empty(self):
         result = load_config(None)
         # find_config_file may return None when CWD has no pyproject.toml; in that case
         # load_config falls through to an empty dict.
         assert isinstance(result, dict)
 
+    def test_rereads_edited_file(self, tmp_path):
+        _write_pyproject(tmp_path, b"[tool.octowrap]\nline-length = 120\n")
+        assert load_config(tmp_path / "pyproject.toml") == {"line-length": 120}
+        _write_pyproject(
+            tmp_path, b"[tool.octowrap]\nline-length = 99\nrecursive = true\n"
+        )
+        result = load_config(tmp_path / "pyproject.toml")
+        assert result == {"line-length": 99, "recursive": True}
+
+    def test_mutating_result_does_not_leak_into_cache(self, tmp_path):
+        _write_pyproject(tmp_path, b'[tool.octowrap]\nexclude = ["a"]\n')
+        load_config(tmp_path / "pyproject.toml")["exclude"].append("b")
+        assert load_config(tmp_path / "pyproject.toml") == {"exclude": ["a"]}
+
     def test_unknown_key_raises(self, tmp_path):
         _write_pyproject(tmp_path, b"[tool.octowrap]\nbogus = 42\n")
         with pytest.raises(ConfigError, match="Unknown config key"):
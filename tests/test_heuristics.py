@@ -1,9 +1,13 @@
+import textwrap
+
 import pytest
 
 # noinspection PyProtectedMember
 from octowrap.rewrap import (
+    _fill,
     _join_comment_lines,
     _looks_like_prose,
+    classify_content,
     extract_list_marker,
     extract_todo_marker,
     is_divider,
@@ -216,6 +220,10 @@ class TestIsDivider:
         """70% threshold: '----x' is 4/5 = 80% dashes, should pass."""
         assert is_divider("----x")
 
+    def test_repeated_char_not_first(self):
+        """The dominant character needn't be the first one."""
+        assert is_divider("x------")
+
     def test_below_repetition_threshold(self):
         """'--xx' is 2/4 = 50% for each char, below 70%."""
         assert not is_divider("--xx")
@@ -355,6 +363,25 @@ class TestShouldPreserveLine:
         assert not should_preserve_line("type: ignore")
 
 
+class TestClassifyContent:
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("", "blank"),
+            ("   ", "blank"),
+            ("- item", "list"),
+            ("  2) nested item", "list"),
+            ("x = compute(y)", "preserve"),
+            ("----------", "preserve"),
+            ("noqa: E501", "preserve"),
+            ("TODO: fix this", "text"),
+            ("Plain prose goes here.", "text"),
+        ],
+    )
+    def test_classifies(self, text, expected):
+        assert classify_content(text) == expected
+
+
 class TestIsTodoMarker:
     """Tests for is_todo_marker()."""
 
@@ -436,6 +463,20 @@ class TestIsTodoMarker:
         """'TEST:' pattern should not match 'TESTING:' — the colon anchors it."""
         assert not is_todo_marker("TESTING: something", patterns=["TEST:"])
 
+    def test_non_ascii_case_fold_still_matches(self):
+        """Characters re.IGNORECASE folds onto ASCII (the Kelvin sign) still match."""
+        assert is_todo_marker("\u212aEEP this", patterns=["keep"])
+        assert not is_todo_marker(
+            "\u212aEEP this", patterns=["keep"], case_sensitive=True
+        )
+
+    def test_non_ascii_pattern_start(self):
+        assert is_todo_marker("\u00c9TAPE: next", patterns=["\u00e9tape"])
+        assert not is_todo_marker("etape: next", patterns=["\u00e9tape"])
+
+    def test_empty_pattern_matches_anything(self):
+        assert is_todo_marker("anything", patterns=[""])
+
 
 class TestIsTodoContinuation:
     """Tests for is_todo_continuation()."""
@@ -512,6 +553,11 @@ class TestExtractTodoMarker:
         assert marker == "NOTE: "
         assert content == "important"
 
+    def test_empty_patterns_no_match(self):
+        """No patterns means no marker, even for text the prefilter can't rule out."""
+        assert extract_todo_marker("TODO: fix", patterns=[]) == ("", "TODO: fix")
+        assert extract_todo_marker("\u00e9tape", patterns=[]) == ("", "\u00e9tape")
+
     def test_extra_whitespace_after_colon(self):
         marker, content = extract_todo_marker("TODO:  extra spaces")
         assert marker == "TODO:  "
@@ -616,6 +662,38 @@ class TestJoinCommentLines:
         assert _join_comment_lines(lines) == expected
 
 
+class TestFill:
+    """Tests for _fill, the textwrap.fill replacement used when rewrapping."""
+
+    @pytest.mark.parametrize(
+        "text, width, initial, subsequent",
+        [
+            ("one two three four five six seven", 10, "", ""),
+            ("exactly ten chars here", 10, "", ""),
+            ("a https://example.com/a/very/long/url b", 12, "", ""),
+            ("a command-line-interface here", 12, "", ""),
+            ("first line then the rest of it", 16, "# TODO: ", "#  "),
+            ("double  spaced  text here", 10, "", ""),
+            (" leading and trailing ", 10, "", ""),
+            ("tab\tseparated words go here", 10, "", ""),
+            ("non\xa0breaking space words here", 10, "", ""),
+        ],
+    )
+    def test_matches_textwrap(self, text, width, initial, subsequent):
+        expected = textwrap.fill(
+            text,
+            width=width,
+            initial_indent=initial,
+            subsequent_indent=subsequent,
+            break_on_hyphens=False,
+            break_long_words=False,
+        ).split("\n")
+        assert _fill(text, width, initial, subsequent) == expected
+
+    def test_empty_text(self):
+        assert _fill("", 10, "# ") == [""]
+
+
 class TestExtractListMarker:
     """Tests for extract_list_marker()."""
 
@@ -128,6 +128,18 @@ class TestProcessContentInline:
         # Code line should be last, without the comment
         assert lines[-1] == "x = some_really_long_function_call(arg1, arg2)"
 
+    def test_short_neighbours_kept_around_extraction(self):
+        """Short code lines next to an extracted comment stay as they were."""
+        long_line = "x = some_really_long_function_call(arg1, arg2)  # This comment pushes the line way past the limit\n"
+        content = "a = 1  # short\n" + long_line + "b = 2\n"
+        changed, result = process_content(content, max_line_length=88)
+        assert changed
+        lines = result.splitlines()
+        assert lines[0] == "a = 1  # short"
+        assert lines[1].startswith("# This comment pushes")
+        assert lines[-2] == "x = some_really_long_function_call(arg1, arg2)"
+        assert lines[-1] == "b = 2"
+
     def test_tool_directive_preserved(self):
         """type: ignore and other directives are never extracted."""
         # Build a line that overflows but has a tool directive
@@ -209,6 +221,13 @@ class TestProcessContentInline:
         changed, result = process_content(content, max_line_length=88)
         assert not changed
 
+    def test_long_line_with_hash_in_string_untouched(self):
+        """A long code line whose only '#' is inside a string is not modified."""
+        content = "x = '" + "#" * 90 + "'\n"
+        changed, result = process_content(content, max_line_length=88)
+        assert not changed
+        assert result == content
+
     def test_extracted_comment_wraps_to_line_length(self):
         """The extracted comment block respects max_line_length."""
         content = "x = func()  # This is a really long inline comment that definitely exceeds the forty character limit when extracted\n"
@@ -227,6 +246,11 @@ class TestCountChangedBlocksInline:
         count = count_changed_blocks(content, max_line_length=88)
         assert count == 1
 
+    def test_no_hash_counts_zero(self):
+        content = "x = some_really_long_function_call(arg1, arg2, arg3, arg4, arg5, arg6, arg7)\n"
+        count = count_changed_blocks(content, max_line_length=88)
+        assert count == 0
+
     def test_does_not_count_short_inline(self):
         content = "x = 1  # short\n"
         count = count_changed_blocks(content, max_line_length=88)
@@ -4,7 +4,12 @@ from pathlib import Path
 import pytest
 
 # noinspection PyProtectedMember
-from octowrap.rewrap import _relative_path, process_content, process_file
+from octowrap.rewrap import (
+    _process_file_texts,
+    _relative_path,
+    process_content,
+    process_file,
+)
 
 
 def _raise_os_error(*_args, **_kwargs):
@@ -40,6 +45,27 @@ class TestProcessContent:
         assert not changed
         assert result == content
 
+    def test_form_feed_not_treated_as_line_break(self):
+        """A form feed stays part of its line instead of splitting it."""
+        content = "x = 1\x0c\n# Short comment.\ny = 2\x0cz = 3\n"
+        changed, result = process_content(content, max_line_length=88)
+        assert not changed
+        assert result == content
+
+    def test_mixed_endings_follow_first_line(self):
+        """Mixed endings are normalized to whatever ends the first line."""
+        content = "# Short comment.\nx = 1\r\n"
+        changed, result = process_content(content, max_line_length=88)
+        assert changed
+        assert result == "# Short comment.\nx = 1\n"
+
+    def test_content_without_hash_returned_as_is(self):
+        """Content with no '#' is returned untouched, mixed endings included."""
+        content = "x = 1\r\ny = 2\n"
+        changed, result = process_content(content, max_line_length=88)
+        assert not changed
+        assert result is content
+
     def test_empty_string(self):
         """Empty string returns (False, '')."""
         changed, result = process_content("", max_line_length=88)
@@ -66,6 +92,26 @@ class TestProcessFile:
         changed, content = process_file(f, max_line_length=88)
         assert not changed
 
+    def test_file_without_comments_left_untouched(self, tmp_path):
+        """A file with no '#' at all is returned as is, mixed endings included."""
+        f = tmp_path / "nocomments.py"
+        f.write_bytes(b"x = 1\r\ny = 2\n")
+        changed, content = process_file(f, max_line_length=88)
+        assert not changed
+        assert content == "x = 1\r\ny = 2\n"
+        assert f.read_bytes() == b"x = 1\r\ny = 2\n"
+
+    def test_uses_supplied_content_instead_of_reading(self, tmp_path):
+        """Passing content skips the read; the file is only written on change."""
+        f = tmp_path / "stale.py"
+        f.write_bytes(b"x = 1\n")
+        changed, content = process_file(
+            f, max_line_length=88, content=WRAPPABLE_CONTENT.decode()
+        )
+        assert changed
+        assert "wrapped at a short width previously." in content
+        assert f.read_text() == content
+
     def test_dry_run_does_not_write(self, tmp_path):
         """dry_run=True should not modify the file on disk."""
         original = (
@@ -611,6 +657,22 @@ class TestRelativePath:
         assert result == target
 
 
+class TestProcessFileTexts:
+    def test_changed_returns_both_texts(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_bytes(WRAPPABLE_CONTENT)
+        changed, original, new = _process_file_texts(f, dry_run=True)
+        assert changed
+        assert original == WRAPPABLE_CONTENT.decode()
+        assert new != original
+
+    def test_unchanged_returns_no_text(self, tmp_path):
+        """Unchanged files don't ship their contents back from pool workers."""
+        f = tmp_path / "a.py"
+        f.write_bytes(b"x = 1\n")
+        assert _process_file_texts(f, dry_run=True) == (False, "", "")
+
+
 class TestTodoIntegration:
     """Integration tests for TODO rewrap through process_content."""
 
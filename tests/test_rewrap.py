@@ -20,7 +20,50 @@ def test_text_width_too_narrow_returns_original():
     )
     # indent (24) + "# " (2) = 26, leaving only 4 chars of text width (< 20)
     result = rewrap_comment_block(block, max_line_length=30)
-    assert result == block["lines"]
+    assert result == block.lines
+
+
+def test_preserved_only_block_unchanged():
+    """A block of only blank and preserved lines comes back as is."""
+    block = make_block(["# x = compute(y)", "#", "# ----------------------------"])
+    result = rewrap_comment_block(block, max_line_length=88)
+    assert result == block.lines
+
+
+def test_whitespace_only_line_normalized_in_preserved_block():
+    """A comment line holding only spaces still collapses to a bare '#'."""
+    block = make_block(["# x = compute(y)", "#   "])
+    result = rewrap_comment_block(block, max_line_length=88)
+    assert result == ["# x = compute(y)", "#"]
+
+
+def test_single_line_without_space_after_hash_rewrapped():
+    """A lone short line missing the space after '#' is still normalized."""
+    block = make_block(["#Short."])
+    result = rewrap_comment_block(block, max_line_length=88)
+    assert result == ["# Short."]
+
+
+def test_repeated_block_returns_fresh_list():
+    """Memoized results are copied, so mutating one can't leak into the next call."""
+    lines = ["# This is a comment that was wrapped", "# at a short width previously."]
+    first = rewrap_comment_block(make_block(lines), max_line_length=88)
+    first.append("# mutated")
+    second = rewrap_comment_block(make_block(list(lines)), max_line_length=88)
+    assert second == [
+        "# This is a comment that was wrapped at a short width previously."
+    ]
+
+
+def test_repeated_block_honors_changed_settings():
+    """A block seen before is rewrapped again when any setting differs."""
+    lines = ["# NOTE: the first line", "#  carries on here."]
+    default = rewrap_comment_block(make_block(lines), max_line_length=88)
+    custom = rewrap_comment_block(
+        make_block(lines), max_line_length=88, todo_patterns=["NOTE"]
+    )
+    assert default == ["# NOTE: the first line  carries on here."]
+    assert custom == ["# NOTE: the first line carries on here."]
 
 
 def test_list_items_preserved():
@@ -79,7 +122,7 @@ class TestRewrapToWiderLength:
             ]
         )
         result = rewrap_comment_block(block, max_line_length=88)
-        assert len(result) < len(block["lines"])
+        assert len(result) < len(block.lines)
         for line in result:
             assert len(line) <= 88
 
@@ -94,7 +137,7 @@ class TestRewrapToWiderLength:
             ]
         )
         result = rewrap_comment_block(block, max_line_length=88)
-        assert len(result) < len(block["lines"])
+        assert len(result) < len(block.lines)
         for line in result:
             assert len(line) <= 88
 
@@ -109,7 +152,7 @@ class TestRewrapToWiderLength:
             indent="    ",
         )
         result = rewrap_comment_block(block, max_line_length=88)
-        assert len(result) < len(block["lines"])
+        assert len(result) < len(block.lines)
         for line in result:
             assert len(line) <= 88
             assert line.startswith("    # ")
@@ -125,7 +168,7 @@ class TestRewrapToWiderLength:
         )
         result = rewrap_comment_block(block, max_line_length=88)
 
-        original_text = " ".join(line.lstrip("# ") for line in block["lines"])
+        original_text = " ".join(line.lstrip("# ") for line in block.lines)
         result_text = " ".join(line.lstrip("# ") for line in result)
         assert original_text.split() == result_text.split()
 
@@ -354,6 +397,12 @@ class TestTodoRewrap:
         result = rewrap_comment_block(block, max_line_length=88)
         assert result == ["# TODO:"]
 
+    def test_bare_todo_marker_followed_by_prose_preserved(self):
+        """A bare TODO stays as is when a separate prose line follows it."""
+        block = make_block(["# TODO:", "# Some prose."])
+        result = rewrap_comment_block(block, max_line_length=88)
+        assert result == ["# TODO:", "# Some prose."]
+
     def test_multiline_todo_collected(self):
         """Continuation lines (one-space indent) should be collected into the TODO."""
         block = make_block(
@@ -611,7 +660,7 @@ class TestListWrap:
             ]
         )
         result = rewrap_comment_block(block, max_line_length=88, list_wrap=False)
-        assert result == block["lines"]
+        assert result == block.lines
 
     def test_bare_marker_preserved(self):
         """A bare marker with no content should be preserved."""
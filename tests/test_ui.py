@@ -49,7 +49,7 @@ class TestShowBlockDiff:
         assert show_block_diff(lines, lines, 0) is False
         assert capsys.readouterr().out == ""
 
-    def test_changes_returns_true(self, capsys):
+    def test_changes_returns_true(self):
         original = ["# hello", "# world"]
         new = ["# hello world"]
         assert show_block_diff(original, new, 0) is True